@@ -0,0 +1,47 @@
+"""
+Convert the Secondary Rankings CSV extract to Parquet
+
+One-off helper for local development: the Streamlit app reads
+secondary_ranks_new_prepared.parquet in preference to the CSV when it exists,
+so run this again whenever the CSV extract is refreshed.
+
+Usage:
+    python convert_rankings_to_parquet.py [input.csv] [output.parquet]
+"""
+
+import sys
+import pandas as pd
+
+# Mirror CATEGORY_ORDER / POSITION_ORDER in player_evaluation_app.py
+CATEGORY_ORDER = [
+    'Elite', 'Producer', 'Prospect', 'Riser', 'Risk', 'Developmental'
+]
+POSITION_ORDER = ['CB', 'SAF']
+
+
+def convert(csv_path="secondary_ranks_new_prepared.csv",
+            parquet_path="secondary_ranks_new_prepared.parquet"):
+    """Write the CSV extract to Parquet with the label columns stored as categoricals"""
+    df = pd.read_csv(csv_path)
+
+    extra_categories = [
+        c for c in df['player_category'].dropna().unique() if c not in CATEGORY_ORDER
+    ]
+    df['player_category'] = pd.Categorical(
+        df['player_category'], categories=CATEGORY_ORDER + extra_categories, ordered=True
+    )
+    extra_positions = sorted(
+        p for p in df['position'].dropna().unique() if p not in POSITION_ORDER
+    )
+    df['position'] = pd.Categorical(
+        df['position'], categories=POSITION_ORDER + extra_positions, ordered=True
+    )
+    if 'draft_club_name' in df.columns:
+        df['draft_club_name'] = df['draft_club_name'].astype('category')
+
+    df.to_parquet(parquet_path, engine='pyarrow', index=False)
+    print(f"Wrote {len(df)} rows x {len(df.columns)} columns to {parquet_path}")
+
+
+if __name__ == "__main__":
+    convert(*sys.argv[1:3])
@@ -15,10 +15,17 @@ Data Source: secondary_ranks_new_prepared (Dataiku Dataset)
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
 from great_tables import GT, md, html, style, loc
+import copy
 import io
+import os
+import time
+from dataclasses import dataclass
+from functools import cached_property
+
+import tracking_kernels
+from tracking_kernels import count_zones, lttb_indices, speed_range, summarize_tracking
 
 # ============================================================================
 # PAGE CONFIG
@@ -35,7 +42,10 @@ st.set_page_config(
 # CUSTOM CSS
 # ============================================================================
 
-st.markdown("""
+@st.cache_resource
+def get_custom_css():
+    """Build the page CSS once per process"""
+    return """
 <style>
     /* Metric styling */
     [data-testid="stMetricValue"] {
@@ -77,7 +87,11 @@ st.markdown("""
         text-align: center;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Streamlit removes elements that a rerun doesn't re-emit, so the cached
+# string is still written on every run
+st.markdown(get_custom_css(), unsafe_allow_html=True)
 
 # ============================================================================
 # CATEGORY COLORS
@@ -92,28 +106,133 @@ CATEGORY_COLORS = {
     'Developmental': '#6c757d'  # Gray - Depth/Average
 }
 
+POSITION_COLORS = {
+    'CB': '#1f77b4',   # Blue
+    'SAF': '#d62728'   # Red
+}
+
 # Order for display - categories that don't exist in data will be filtered out
 CATEGORY_ORDER = [
     'Elite', 'Producer', 'Prospect', 'Riser', 'Risk', 'Developmental'
 ]
 
+# Position order for sorting and grouping; positions not listed sort after
+POSITION_ORDER = ['CB', 'SAF']
+
+# Bar colors in CATEGORY_ORDER, computed once at import
+_CATEGORY_BAR_COLORS = [CATEGORY_COLORS.get(c, '#6c757d') for c in CATEGORY_ORDER]
+
 # ============================================================================
 # DATA LOADING
 # ============================================================================
 
-@st.cache_data
+# Local copies of the rankings extract; the Parquet file is written by
+# convert_rankings_to_parquet.py and is preferred when present
+RANKINGS_CSV = "secondary_ranks_new_prepared.csv"
+RANKINGS_PARQUET = "secondary_ranks_new_prepared.parquet"
+
+# Columns read by the app's tabs; also the Rankings Table export columns
+RANKINGS_COLUMNS = [
+    'player_display_name', 'position', 'player_category', 'RAS',
+    'athletic_potential_score', 'college_production_score',
+    'nfl_production_score', 'composite_score',
+    'athletic_potential_rank', 'college_production_rank',
+    'nfl_production_rank', 'composite_rank',
+    'headshot_url', 'draft_season', 'draft_round', 'draft_overall_selection',
+    'draft_club_name', 'team_name', 'gsis_player_id',
+]
+
+def read_local_rankings():
+    """Read the local rankings extract, preferring the Parquet copy"""
+    if os.path.exists(RANKINGS_PARQUET):
+        try:
+            import pyarrow.parquet as pq
+            # Only read the columns the app uses (and the file has)
+            available = set(pq.read_schema(RANKINGS_PARQUET).names)
+            columns = [c for c in RANKINGS_COLUMNS if c in available]
+            return pd.read_parquet(RANKINGS_PARQUET, columns=columns, engine='pyarrow')
+        except ImportError:
+            pass
+    return pd.read_csv(RANKINGS_CSV)
+
+# Columns given pre-formatted '<col>_display' strings at load time
+PROFILE_SCORE_COLUMNS = {
+    'RAS': 2,
+    'athletic_potential_score': 1,
+    'college_production_score': 1,
+    'nfl_production_score': 1,
+    'composite_score': 1,
+}
+PROFILE_RANK_COLUMNS = [
+    'athletic_potential_rank', 'college_production_rank',
+    'nfl_production_rank', 'composite_rank',
+]
+
+def prepare_rankings_data(df):
+    """Add the categorical encodings and display columns the app reads"""
+    # Encode the low-cardinality labels once so filters, groupbys and sorts
+    # work on integer codes; unknown categories sort after CATEGORY_ORDER
+    extra_categories = [
+        c for c in df['player_category'].dropna().unique() if c not in CATEGORY_ORDER
+    ]
+    df['player_category'] = pd.Categorical(
+        df['player_category'], categories=CATEGORY_ORDER + extra_categories, ordered=True
+    )
+    extra_positions = sorted(
+        p for p in df['position'].dropna().unique() if p not in POSITION_ORDER
+    )
+    df['position'] = pd.Categorical(
+        df['position'], categories=POSITION_ORDER + extra_positions, ordered=True
+    )
+    if 'draft_club_name' in df.columns:
+        df['draft_club_name'] = df['draft_club_name'].astype('category')
+    
+    # Draft pick label ('R1 #15' or 'UDFA') built once for the whole frame
+    if 'draft_round' in df.columns:
+        df['draft_pick_display'] = (
+            format_int_column(df['draft_round'], prefix="R") + " " +
+            format_int_column(df['draft_overall_selection'], prefix="#")
+        ).where(df['draft_round'].notna(), "UDFA")
+    else:
+        df['draft_pick_display'] = "UDFA"
+    
+    # Score and rank strings for the Player Profile ('81.3', '#12')
+    for col, decimals in PROFILE_SCORE_COLUMNS.items():
+        if col in df.columns:
+            df[f'{col}_display'] = format_float_column(df[col], decimals=decimals, na_value="N/A")
+        else:
+            df[f'{col}_display'] = "N/A"
+    for col in PROFILE_RANK_COLUMNS:
+        if col in df.columns:
+            df[f'{col}_display'] = format_int_column(df[col], prefix="#")
+        else:
+            df[f'{col}_display'] = "—"
+    
+    return df
+
+@st.cache_data(persist='disk')
+def _load_dataiku_rankings():
+    """Read and prepare the Dataiku rankings dataset, persisted to disk across restarts
+    
+    Raises when Dataiku can't be reached, so only a real Dataiku result is ever persisted.
+    """
+    import dataiku
+    dataset = dataiku.Dataset("secondary_ranks_new_prepared")
+    return prepare_rankings_data(dataset.get_dataframe())
+
+@st.cache_data(ttl=600)
 def load_rankings_data():
-    """Load the secondary rankings data from Dataiku dataset"""
+    """Load the secondary rankings data from Dataiku dataset
+    
+    The sample-data fallback is only cached in memory for 10 minutes, so Dataiku
+    is tried again after an outage.
+    """
     try:
-        import dataiku
-        dataset = dataiku.Dataset("secondary_ranks_new_prepared")
-        df = dataset.get_dataframe()
+        return _load_dataiku_rankings()
     except:
         # Fallback for local development
         st.warning("⚠️ Could not connect to Dataiku. Using sample data.")
-        df = pd.read_csv("secondary_ranks_new_prepared.csv")
-    
-    return df
+        return prepare_rankings_data(read_local_rankings())
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -123,16 +242,113 @@ def get_category_color(category):
     """Get color for a category"""
     return CATEGORY_COLORS.get(category, '#6c757d')
 
+CATEGORY_BADGE_TEMPLATE = '<span class="category-badge" style="background-color: {color}; color: white;">{category}</span>'
+
+# Badge HTML for the known categories, built once at import
+CATEGORY_BADGES = {
+    category: CATEGORY_BADGE_TEMPLATE.format(color=color, category=category)
+    for category, color in CATEGORY_COLORS.items()
+}
+
 def get_category_badge(category):
     """Generate HTML badge for category"""
-    color = get_category_color(category)
-    return f'<span class="category-badge" style="background-color: {color}; color: white;">{category}</span>'
+    badge = CATEGORY_BADGES.get(category)
+    if badge is None:
+        badge = CATEGORY_BADGE_TEMPLATE.format(color=get_category_color(category), category=category)
+    return badge
+
+@dataclass(eq=False)
+class FilteredView:
+    """Sidebar filter result: the full rankings frame plus a boolean row mask"""
+    base: pd.DataFrame
+    mask: np.ndarray
+    
+    def __len__(self):
+        return int(self.mask.sum())
+    
+    @cached_property
+    def frame(self):
+        """All columns for the filtered rows, materialised on first use"""
+        return self.base[self.mask]
+    
+    def take(self, positions):
+        """Rows at the given positions within the filtered view, without building .frame"""
+        return self.base.iloc[np.flatnonzero(self.mask)[positions]]
+    
+    def select(self, columns):
+        """Filtered rows projected to the given columns (those present in the data)"""
+        return self.base.loc[self.mask, [c for c in columns if c in self.base.columns]]
+
+def format_int_column(series, prefix="", na_value="—"):
+    """Format a numeric column as f"{prefix}{int(x)}", using na_value for missing"""
+    valid = series.notna()
+    formatted = pd.Series(na_value, index=series.index, dtype=object)
+    formatted[valid] = prefix + series[valid].astype('int64').astype(str)
+    return formatted
+
+def format_float_column(series, decimals=1, na_value="—"):
+    """Format a numeric column with a fixed number of decimals, using na_value for missing"""
+    return series.map(f'{{:.{decimals}f}}'.format, na_action='ignore').where(series.notna(), na_value)
+
+def column_values(df, column, na_value=None):
+    """Return a column as an object array, with missing values (or a missing column) as na_value"""
+    if column not in df.columns:
+        return np.full(len(df), na_value, dtype=object)
+    values = df[column]
+    return values.astype(object).where(values.notna(), na_value).to_numpy()
+
+def truncate_text_column(series, max_len=18, keep=15, na_value="—"):
+    """Shorten long labels to their first `keep` characters plus '...'"""
+    text = series.astype(str)
+    shortened = text.where(text.str.len() <= max_len, text.str.slice(0, keep) + "...")
+    return shortened.where(series.notna(), na_value)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_player_options(df):
+    """Build 'POS - Player' labels sorted by position, then player name
+    
+    Returns (labels, label_to_name) so selections map back to player names
+    without re-parsing the labels.
+    """
+    sorted_df = df[['position', 'player_display_name']].sort_values(['position', 'player_display_name'])
+    labels = (sorted_df['position'].astype(str) + ' - ' + sorted_df['player_display_name'].astype(str)).tolist()
+    return labels, dict(zip(labels, sorted_df['player_display_name'].tolist()))
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def sort_rankings(df, sort_col, ascending):
+    """Sort the rankings and return (sorted_df, content_key)
+    
+    The content key is a hash of the sorted rows, used to share exports and
+    the rendered table across reruns and sessions.
+    """
+    values = df[sort_col]
+    # Skip the sort when the column is already ordered (e.g. the extract is
+    # stored by composite rank); NaNs make both checks False
+    already_sorted = values.is_monotonic_increasing if ascending else values.is_monotonic_decreasing
+    sorted_df = df if already_sorted else df.sort_values(sort_col, ascending=ascending, kind='stable')
+    key = pd.util.hash_pandas_object(sorted_df, index=False).values.tobytes()
+    return sorted_df, key
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_position_averages(df):
+    """Average pillar scores per position (one row per position)"""
+    pillar_cols = ['athletic_potential_score', 'college_production_score', 'nfl_production_score']
+    return df.groupby('position', observed=True)[pillar_cols].mean()
 
-def format_draft_pick(row):
-    """Format draft pick as 'R1 #15' or 'UDFA'"""
-    if pd.isna(row.get('draft_round')):
-        return "UDFA"
-    return f"R{int(row['draft_round'])} #{int(row['draft_overall_selection'])}"
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_players_by_name(df):
+    """Map player_display_name -> row dict (first row wins, like .iloc[0])"""
+    players = {}
+    for name, record in zip(df['player_display_name'], df.to_dict('records')):
+        players.setdefault(name, record)
+    return players
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def get_name_index(df):
+    """Index of player names and their row positions (first row wins for duplicate names)"""
+    names = pd.Index(df['player_display_name'])
+    first = ~names.duplicated()
+    return names[first], np.flatnonzero(first)
 
 def create_radar_chart(player_data, position_avg=None):
     """Create radar chart for player's 3 pillars"""
@@ -193,62 +409,88 @@ def create_radar_chart(player_data, position_avg=None):
     
     return fig
 
+# Above this many points the scatter is rasterized with Datashader (if installed)
+SCATTER_RASTER_THRESHOLD = 5000
+
+def rasterize_scatter(plot_df, color_by, color_map):
+    """Render the RAS vs NFL Production scatter as a Datashader image (PIL)"""
+    import datashader as ds
+    import datashader.transfer_functions as tf
+    
+    points = plot_df[['RAS', 'nfl_production_score']].assign(
+        group=plot_df[color_by].astype('category')
+    )
+    color_key = {
+        cat: color_map.get(cat, '#6c757d') for cat in points['group'].cat.categories
+    }
+    
+    canvas = ds.Canvas(plot_width=850, plot_height=500, x_range=(0, 10.5), y_range=(0, 105))
+    agg = canvas.points(points, 'RAS', 'nfl_production_score', ds.count_cat('group'))
+    img = tf.shade(agg, color_key=color_key)
+    return tf.set_background(img, 'white').to_pil()
+
+# Columns read by create_scatter_plot (the cache key only hashes these)
+SCATTER_COLUMNS = [
+    'player_display_name', 'position', 'player_category',
+    'RAS', 'nfl_production_score', 'composite_score',
+]
+
+@st.cache_data(max_entries=32, show_spinner=False)
 def create_scatter_plot(df, color_by='player_category'):
-    """Create scatter plot of RAS vs NFL Production"""
+    """Create scatter plot of RAS vs NFL Production
+    
+    Returns a Plotly figure, or a PIL image when the point count exceeds
+    SCATTER_RASTER_THRESHOLD and Datashader is available.
+    """
     
     # Filter out rows with missing data
-    plot_df = df.dropna(subset=['RAS', 'nfl_production_score']).copy()
+    plot_df = df.dropna(subset=['RAS', 'nfl_production_score'])
     
     if len(plot_df) == 0:
         return None
     
-    # Create hover text
-    plot_df['hover_text'] = plot_df.apply(
-        lambda row: f"<b>{row['player_display_name']}</b><br>" +
-                    f"Position: {row['position']}<br>" +
-                    f"Category: {row['player_category']}<br>" +
-                    f"RAS: {row['RAS']:.2f}<br>" +
-                    f"NFL Score: {row['nfl_production_score']:.1f}<br>" +
-                    f"Composite: {row['composite_score']:.1f}",
-        axis=1
-    )
+    color_map = CATEGORY_COLORS if color_by == 'player_category' else POSITION_COLORS
     
-    if color_by == 'player_category':
-        color_map = CATEGORY_COLORS
-        fig = px.scatter(
-            plot_df,
-            x='RAS',
-            y='nfl_production_score',
-            color='player_category',
-            size='composite_score',
-            hover_name='player_display_name',
-            hover_data={
-                'position': True,
-                'RAS': ':.2f',
-                'nfl_production_score': ':.1f',
-                'composite_score': ':.1f',
-                'player_category': True
-            },
-            color_discrete_map=color_map,
-            category_orders={'player_category': CATEGORY_ORDER}
-        )
-    else:  # color by position
-        fig = px.scatter(
-            plot_df,
-            x='RAS',
-            y='nfl_production_score',
-            color='position',
-            size='composite_score',
-            hover_name='player_display_name',
-            hover_data={
-                'position': True,
-                'RAS': ':.2f',
-                'nfl_production_score': ':.1f',
-                'composite_score': ':.1f',
-                'player_category': True
-            },
-            color_discrete_map={'CB': '#1f77b4', 'SAF': '#d62728'}
-        )
+    if len(plot_df) > SCATTER_RASTER_THRESHOLD:
+        try:
+            return rasterize_scatter(plot_df, color_by, color_map)
+        except ImportError:
+            pass  # Datashader not installed - fall back to WebGL markers
+
+    # One WebGL trace per color group, fed NumPy arrays directly (no
+    # plotly.express DataFrame introspection)
+    # Area-scaled markers like px.scatter: the largest composite maps to 20px
+    max_composite = plot_df['composite_score'].max()
+    size_ref = 2.0 * max_composite / (20 ** 2) if max_composite > 0 else 1.0
+    
+    fig = go.Figure()
+    for group, group_df in plot_df.groupby(color_by, observed=True):
+        fig.add_trace(go.Scattergl(
+            x=group_df['RAS'].to_numpy(),
+            y=group_df['nfl_production_score'].to_numpy(),
+            mode='markers',
+            name=str(group),
+            text=group_df['player_display_name'].to_numpy(),
+            customdata=np.column_stack([
+                group_df['position'].astype(str).to_numpy(),
+                group_df['player_category'].astype(str).to_numpy()
+            ]),
+            marker=dict(
+                size=group_df['composite_score'].to_numpy(),
+                sizemode='area',
+                sizeref=size_ref,
+                color=color_map.get(group, '#6c757d')
+            ),
+            hovertemplate=(
+                '<b>%{text}</b><br>'
+                'Position: %{customdata[0]}<br>'
+                'Category: %{customdata[1]}<br>'
+                'RAS: %{x:.2f}<br>'
+                'NFL Score: %{y:.1f}<br>'
+                'Composite: %{marker.size:.1f}'
+                '<extra></extra>'
+            )
+        ))
     
     # Add quadrant lines
     fig.add_hline(y=66.67, line_dash="dot", line_color="gray", opacity=0.5)
@@ -271,16 +513,21 @@ def create_scatter_plot(df, color_by='player_category'):
     
     return fig
 
+@st.cache_data(max_entries=32, show_spinner=False)
 def create_category_bar_chart(df):
     """Create horizontal bar chart of category distribution"""
     
-    category_counts = df['player_category'].value_counts().reindex(CATEGORY_ORDER).fillna(0)
+    category_counts = (
+        df.groupby('player_category', observed=True, sort=False)
+        .size()
+        .reindex(CATEGORY_ORDER, fill_value=0)
+    )
     
     fig = go.Figure(go.Bar(
         x=category_counts.values,
         y=category_counts.index,
         orientation='h',
-        marker_color=[CATEGORY_COLORS.get(cat, '#6c757d') for cat in category_counts.index]
+        marker_color=_CATEGORY_BAR_COLORS
     ))
     
     fig.update_layout(
@@ -305,7 +552,7 @@ def create_great_table(df):
     ]
     
     available_cols = [c for c in display_cols if c in df.columns]
-    table_df = df[available_cols].copy()
+    table_df = df[available_cols]
     
     # Rename columns
     column_rename = {
@@ -327,46 +574,41 @@ def create_great_table(df):
     
     table_df = table_df.rename(columns={k: v for k, v in column_rename.items() if k in table_df.columns})
     
-    # Sort by category order then composite rank
-    table_df['Category_Order'] = table_df['Category'].apply(
-        lambda x: CATEGORY_ORDER.index(x) if x in CATEGORY_ORDER else 99
-    )
-    table_df = table_df.sort_values(['Category_Order', 'Overall'], ascending=[True, True])
-    table_df = table_df.drop(columns=['Category_Order'])
+    # Sort by category order then composite rank (Category is an ordered
+    # categorical, so this sorts on its codes)
+    table_df = table_df.sort_values(['Category', 'Overall'], ascending=[True, True], kind='stable')
     
-    # Format columns
+    # Format columns (whole-column operations, no per-row callbacks)
     if 'Year' in table_df.columns:
-        table_df['Year'] = table_df['Year'].apply(lambda x: f"{int(x)}" if pd.notna(x) else "—")
+        table_df['Year'] = format_int_column(table_df['Year'])
     
     if 'Round' in table_df.columns:
-        table_df['Round'] = table_df['Round'].apply(lambda x: f"R{int(x)}" if pd.notna(x) else "UDFA")
+        table_df['Round'] = format_int_column(table_df['Round'], prefix="R", na_value="UDFA")
     
     if 'Pick' in table_df.columns:
-        table_df['Pick'] = table_df['Pick'].apply(lambda x: f"#{int(x)}" if pd.notna(x) else "—")
+        table_df['Pick'] = format_int_column(table_df['Pick'], prefix="#")
     
     if 'RAS' in table_df.columns:
-        table_df['RAS'] = table_df['RAS'].apply(lambda x: f"{x:.2f}" if pd.notna(x) else "—")
+        table_df['RAS'] = format_float_column(table_df['RAS'], decimals=2)
     
     rank_cols = ['Ath Rank', 'Col Rank', 'NFL Rank', 'Overall']
     for col in rank_cols:
         if col in table_df.columns:
-            table_df[col] = table_df[col].apply(lambda x: f"{int(x)}" if pd.notna(x) else "—")
+            table_df[col] = format_int_column(table_df[col])
     
     if 'NFL Team' in table_df.columns:
-        table_df['NFL Team'] = table_df['NFL Team'].apply(
-            lambda x: x[:15] + "..." if pd.notna(x) and len(str(x)) > 18 else (x if pd.notna(x) else "—")
-        )
+        table_df['NFL Team'] = truncate_text_column(table_df['NFL Team'])
     
     if 'College' in table_df.columns:
-        table_df['College'] = table_df['College'].apply(
-            lambda x: x[:15] + "..." if pd.notna(x) and len(str(x)) > 18 else (x if pd.notna(x) else "—")
-        )
+        table_df['College'] = truncate_text_column(table_df['College'])
     
     if 'Photo' in table_df.columns:
-        table_df['Photo'] = table_df['Photo'].apply(
-            lambda x: f'<img src="{x}" style="height:40px; width:40px; object-fit:cover; border-radius:50%;">' 
-            if pd.notna(x) and x != '' else '👤'
-        )
+        photo = table_df['Photo']
+        has_photo = photo.notna() & (photo != '')
+        table_df['Photo'] = (
+            '<img src="' + photo.astype(str) +
+            '" style="height:40px; width:40px; object-fit:cover; border-radius:50%;">'
+        ).where(has_photo, '👤')
     
     # Create Great Table
     table = (
@@ -419,58 +661,112 @@ def create_great_table(df):
     
     return table
 
-def style_comparison_table(df, metrics_config):
-    """Apply conditional formatting to comparison dataframe"""
-    
-    def highlight_cells(row):
-        styles = [''] * len(row)
-        
-        metric = row.iloc[0]  # First column is the metric name
-        if metric not in metrics_config:
-            return styles
-        
-        higher_better = metrics_config[metric]
-        
-        # Get numeric values
-        values = []
-        indices = []
-        for idx in range(1, len(row)):
-            try:
-                val = row.iloc[idx]
-                if pd.notna(val) and str(val) not in ['N/A', '—', '']:
-                    clean_val = str(val).replace('%', '').replace('#', '').strip()
-                    values.append(float(clean_val))
-                    indices.append(idx)
-            except:
-                pass
-        
-        if len(values) < 2:
-            return styles
-        
-        best_val = max(values) if higher_better else min(values)
-        
-        for idx, val in zip(indices, values):
-            if val == best_val:
-                styles[idx] = 'background-color: #28a745; color: white; font-weight: bold'
-            elif higher_better and best_val != min(values):
-                ratio = (val - min(values)) / (best_val - min(values))
-                if ratio > 0.7:
-                    styles[idx] = 'background-color: #d4edda; color: #155724'
-            elif not higher_better and best_val != max(values):
-                ratio = (max(values) - val) / (max(values) - best_val)
-                if ratio > 0.7:
-                    styles[idx] = 'background-color: #d4edda; color: #155724'
-        
-        return styles
+@st.cache_resource(max_entries=32, show_spinner=False)
+def render_great_table_html(key, _df):
+    """Render the Great Table to HTML once per distinct table content"""
+    return create_great_table(_df).as_raw_html()
+
+# (label, column, higher_is_better) rows of the Compare tab's table;
+# higher_is_better=None means the row is not highlighted
+COMPARISON_METRICS = [
+    ('RAS', 'RAS', True),
+    ('Athletic Score', 'athletic_potential_score', True),
+    ('Athletic Rank', 'athletic_potential_rank', False),
+    ('College Score', 'college_production_score', True),
+    ('College Rank', 'college_production_rank', False),
+    ('NFL Score', 'nfl_production_score', True),
+    ('NFL Rank', 'nfl_production_rank', False),
+    ('Composite Score', 'composite_score', True),
+    ('Composite Rank', 'composite_rank', False),
+    ('Category', 'player_category', None),
+]
+COMPARISON_COLUMNS = ['player_display_name'] + [col for _, col, _ in COMPARISON_METRICS]
+COMPARISON_METRICS_CONFIG = {
+    metric_name: higher_better
+    for metric_name, _, higher_better in COMPARISON_METRICS
+    if higher_better is not None
+}
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_comparison_display(df):
+    """Format every comparison metric for every player (one row per player, indexed by name)"""
+    formatted = {}
+    for metric_name, col_name, _ in COMPARISON_METRICS:
+        if col_name not in df.columns:
+            formatted[metric_name] = pd.Series('N/A', index=df.index)
+            continue
+        values = df[col_name]
+        if pd.api.types.is_float_dtype(values):
+            if 'Rank' in metric_name:
+                formatted[metric_name] = format_int_column(values, prefix="#", na_value="N/A")
+            else:
+                formatted[metric_name] = format_float_column(values, decimals=1, na_value="N/A")
+        else:
+            formatted[metric_name] = values.astype(str).where(values.notna(), 'N/A')
     
-    return df.style.apply(highlight_cells, axis=1)
+    display = pd.DataFrame(formatted)
+    display.index = df['player_display_name'].to_numpy()
+    return display
 
-def export_to_pdf(df, filename="rankings_export.pdf"):
-    """Export dataframe to PDF (returns bytes)"""
-    # Create a simple HTML table and convert to PDF-like format
-    # Note: Full PDF export requires additional libraries like weasyprint
-    html_content = df.to_html(index=False)
-    return html_content.encode()
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_comparison_best_mask(df, metrics_config):
+    """Boolean mask of the best value per metric row over the player columns of df"""
+    # Parse the player columns into one float matrix ('#12' -> 12.0, 'N/A' -> NaN)
+    values = df.iloc[:, 1:].apply(
+        lambda col: pd.to_numeric(col.astype(str).str.replace(r'[%#]', '', regex=True).str.strip(), errors='coerce')
+    ).to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+    
+    # Only configured metrics with at least two comparable values are marked
+    metrics = df.iloc[:, 0].to_numpy()
+    marked_rows = np.array([m in metrics_config for m in metrics], dtype=bool) & (valid.sum(axis=1) >= 2)
+    higher_better = np.array([bool(metrics_config.get(m, True)) for m in metrics], dtype=bool)[:, None]
+    
+    # NaN-ignoring row extremes (fmax/fmin skip NaN without warnings)
+    row_max = np.fmax.reduce(values, axis=1, keepdims=True)
+    row_min = np.fmin.reduce(values, axis=1, keepdims=True)
+    best = np.where(higher_better, row_max, row_min)
+    
+    return (values == best) & marked_rows[:, None]
+
+def mark_comparison_table(df, metrics_config):
+    """Prefix the best value in each comparable metric row with 🟢"""
+    is_best = get_comparison_best_mask(df, metrics_config)
+    cells = df.iloc[:, 1:].to_numpy(dtype=object)
+    marked = np.where(is_best, '🟢 ' + cells.astype(str), cells)
+    return pd.DataFrame(
+        {'Metric': df.iloc[:, 0].to_numpy(), **dict(zip(df.columns[1:], marked.T))},
+        copy=False
+    )
+
+CSV_EXPORT_CHUNK_ROWS = 10_000
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def export_to_csv(key, _df):
+    """Export dataframe to CSV bytes, serialising CSV_EXPORT_CHUNK_ROWS rows at a time"""
+    buffer = io.BytesIO()
+    for start in range(0, max(len(_df), 1), CSV_EXPORT_CHUNK_ROWS):
+        chunk = _df.iloc[start:start + CSV_EXPORT_CHUNK_ROWS]
+        buffer.write(chunk.to_csv(index=False, header=(start == 0)).encode())
+    return buffer.getvalue()
+
+@st.cache_resource
+def get_pdf_renderer():
+    """Return weasyprint's HTML class, or None when it (or its system libraries) is unavailable"""
+    try:
+        from weasyprint import HTML
+    except (ImportError, OSError):
+        return None
+    return HTML
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def export_to_pdf(key, _df):
+    """Export dataframe to PDF bytes (plain HTML table bytes without weasyprint)"""
+    html_content = _df.to_html(index=False)
+    renderer = get_pdf_renderer()
+    if renderer is None:
+        return html_content.encode()
+    return renderer(string=html_content).write_pdf()
 
 # ============================================================================
 # LOAD DATA
@@ -495,16 +791,18 @@ st.sidebar.markdown("---")
 # Position filter
 position_filter = st.sidebar.radio(
     "Position",
-    ["All", "CB", "SAF"],
+    ["All"] + POSITION_ORDER,
     index=0,
     horizontal=True
 )
 
+# Filters accumulate into one boolean mask over rankings_df; the filtered
+# frame is materialised once at the end
+filter_mask = np.ones(len(rankings_df), dtype=bool)
+
 # Apply position filter
 if position_filter != "All":
-    filtered_df = rankings_df[rankings_df['position'] == position_filter].copy()
-else:
-    filtered_df = rankings_df.copy()
+    filter_mask &= (rankings_df['position'] == position_filter).to_numpy()
 
 # Category filter - only show categories that exist in the data
 all_categories_in_data = rankings_df['player_category'].unique().tolist()
@@ -522,14 +820,14 @@ selected_categories = st.sidebar.multiselect(
 
 # Apply category filter
 if selected_categories:
-    filtered_df = filtered_df[filtered_df['player_category'].isin(selected_categories)]
+    filter_mask &= rankings_df['player_category'].isin(selected_categories).to_numpy()
 else:
     # If nothing selected, show all (avoid empty dataframe)
     selected_categories = available_categories
 
-# Draft year filter
-if 'draft_season' in filtered_df.columns:
-    years = sorted(filtered_df['draft_season'].dropna().unique())
+# Draft year filter (slider bounds come from the players left so far)
+if 'draft_season' in rankings_df.columns:
+    years = sorted(rankings_df.loc[filter_mask, 'draft_season'].dropna().unique())
     if len(years) > 1:
         year_range = st.sidebar.slider(
             "Draft Year",
@@ -537,13 +835,10 @@ if 'draft_season' in filtered_df.columns:
             max_value=int(max(years)),
             value=(int(min(years)), int(max(years)))
         )
-        filtered_df = filtered_df[
-            (filtered_df['draft_season'] >= year_range[0]) & 
-            (filtered_df['draft_season'] <= year_range[1])
-        ]
+        filter_mask &= rankings_df['draft_season'].between(*year_range).to_numpy()
 
 # RAS filter
-if 'RAS' in filtered_df.columns:
+if 'RAS' in rankings_df.columns:
     ras_range = st.sidebar.slider(
         "RAS Range",
         min_value=0.0,
@@ -551,14 +846,13 @@ if 'RAS' in filtered_df.columns:
         value=(0.0, 10.0),
         step=0.5
     )
-    filtered_df = filtered_df[
-        (filtered_df['RAS'] >= ras_range[0]) & 
-        (filtered_df['RAS'] <= ras_range[1]) |
-        filtered_df['RAS'].isna()
-    ]
+    ras = rankings_df['RAS']
+    filter_mask &= (ras.between(*ras_range) | ras.isna()).to_numpy()
+
+filtered_view = FilteredView(rankings_df, filter_mask)
 
 st.sidebar.markdown("---")
-st.sidebar.metric("Players Shown", len(filtered_df))
+st.sidebar.metric("Players Shown", len(filtered_view))
 
 # ============================================================================
 # MAIN CONTENT - TABS
@@ -567,19 +861,33 @@ st.sidebar.metric("Players Shown", len(filtered_df))
 st.title("🏈 Potential vs. Production")
 st.markdown("### Evaluating Secondary Prospects in East-West Shrine Bowl")
 
+# Only the selected tab's body runs (see the `.open` checks below). Streamlit
+# drops the state of widgets that aren't rendered in a run, so re-assign the
+# tab widgets' state to keep their selections while their tab is closed
+TAB_WIDGET_KEYS = [
+    "scatter_color", "profile_select", "compare_select", "table_sort",
+    "export_format", "tracking_player_select", "play_view_option", "view_mode_select",
+]
+for widget_key in TAB_WIDGET_KEYS:
+    if widget_key in st.session_state:
+        st.session_state[widget_key] = st.session_state[widget_key]
+
 tab1, tab2, tab3, tab4, tab5 = st.tabs([
     "📊 Dashboard", 
     "👤 Player Profile", 
     "⚖️ Compare", 
     "📋 Rankings Table",
     "📍 Player Tracking"
-])
+], key="active_tab", on_change="rerun")
 
 # ============================================================================
 # TAB 1: DASHBOARD
 # ============================================================================
 
-with tab1:
+@st.fragment
+def _render_dashboard(filtered_view):
+    """Render the Dashboard tab"""
+    filtered_df = filtered_view.frame
     st.markdown("## Overview")
     
     # KPI Cards
@@ -610,16 +918,20 @@ with tab1:
         color_option = st.radio("Color by:", ["Category", "Position"], horizontal=True, key="scatter_color")
         
         color_by = 'player_category' if color_option == "Category" else 'position'
-        scatter_fig = create_scatter_plot(filtered_df, color_by=color_by)
+        scatter_fig = create_scatter_plot(filtered_view.select(SCATTER_COLUMNS), color_by=color_by)
         
-        if scatter_fig:
+        if scatter_fig is None:
+            st.info("Not enough data to display scatter plot")
+        elif isinstance(scatter_fig, go.Figure):
             st.plotly_chart(scatter_fig, use_container_width=True)
         else:
-            st.info("Not enough data to display scatter plot")
+            # Rasterized (Datashader) rendering for very large player pools
+            st.image(scatter_fig, use_container_width=True)
+            st.caption("RAS (x) vs NFL Production Score (y) - rasterized for large datasets")
     
     with col_dist:
         st.markdown("### Category Distribution")
-        bar_fig = create_category_bar_chart(filtered_df)
+        bar_fig = create_category_bar_chart(filtered_view.select(['player_category']))
         st.plotly_chart(bar_fig, use_container_width=True)
     
     st.markdown("---")
@@ -627,15 +939,25 @@ with tab1:
     # Top Players by Category
     st.markdown("### Top Players by Category")
     
+    # One count pass and one sort/groupby for the top 3 of every category
+    category_counts = filtered_df['player_category'].value_counts()
+    top_players = (
+        filtered_df.dropna(subset=['composite_score'])
+        .sort_values('composite_score', ascending=False, kind='stable')
+        .groupby('player_category', observed=True, sort=False)
+        .head(3)
+    )
+    top_by_category = dict(tuple(top_players.groupby('player_category', observed=True, sort=False)))
+    
     # Only show categories that exist in the filtered data
     categories_to_show = [c for c in ['Elite', 'Producer', 'Prospect', 'Riser', 'Risk'] 
-                          if c in filtered_df['player_category'].values]
+                          if category_counts.get(c, 0) > 0]
     
     for category in categories_to_show:
-        cat_players = filtered_df[filtered_df['player_category'] == category].nlargest(3, 'composite_score')
-        if len(cat_players) > 0:
-            with st.expander(f"{category} ({len(filtered_df[filtered_df['player_category'] == category])})"):
-                for _, player in cat_players.iterrows():
+        cat_players = top_by_category.get(category)
+        if cat_players is not None and len(cat_players) > 0:
+            with st.expander(f"{category} ({category_counts[category]})"):
+                for player in cat_players.to_dict('records'):
                     col_img, col_info = st.columns([1, 5])
                     with col_img:
                         if pd.notna(player.get('headshot_url')):
@@ -643,22 +965,27 @@ with tab1:
                         else:
                             st.write("👤")
                     with col_info:
-                        draft_info = format_draft_pick(player)
+                        draft_info = player['draft_pick_display']
                         st.markdown(f"**{player['player_display_name']}** ({player['position']}) - {draft_info}")
                         st.caption(f"RAS: {player['RAS']:.2f} | Composite: {player['composite_score']:.1f}")
 
+with tab1:
+    if tab1.open:
+        _render_dashboard(filtered_view)
+
 # ============================================================================
 # TAB 2: PLAYER PROFILE
 # ============================================================================
 
-with tab2:
+@st.fragment
+def _render_profile(filtered_view):
+    """Render the Player Profile tab"""
+    filtered_df = filtered_view.frame
     st.markdown("## Player Profile")
     
     # Player selection
-    player_options = ['-- Select a Player --'] + [
-        f"{row['position']} - {row['player_display_name']}" 
-        for _, row in filtered_df.sort_values(['position', 'player_display_name']).iterrows()
-    ]
+    player_labels, label_to_name = build_player_options(filtered_view.select(['position', 'player_display_name']))
+    player_options = ['-- Select a Player --'] + player_labels
     
     selected_player_display = st.selectbox("Select Player", player_options, key="profile_select")
     
@@ -666,8 +993,8 @@ with tab2:
         st.info("👆 Select a player from the dropdown to view their profile")
     else:
         # Parse selection
-        player_name = selected_player_display.split(" - ", 1)[1]
-        player_data = filtered_df[filtered_df['player_display_name'] == player_name].iloc[0]
+        player_name = label_to_name[selected_player_display]
+        player_data = get_players_by_name(filtered_df)[player_name]
         
         # Header with photo and basic info
         col_photo, col_info, col_category = st.columns([1, 3, 2])
@@ -680,7 +1007,7 @@ with tab2:
         
         with col_info:
             st.markdown(f"## {player_data['player_display_name']}")
-            draft_info = format_draft_pick(player_data)
+            draft_info = player_data['draft_pick_display']
             team = player_data.get('draft_club_name', 'N/A')
             college = player_data.get('team_name', 'N/A')
             st.markdown(f"**{player_data['position']}** | {team} | {college}")
@@ -705,26 +1032,21 @@ with tab2:
             st.markdown("### Performance Profile")
             
             # Calculate position average
-            pos_avg = filtered_df[filtered_df['position'] == player_data['position']][
-                ['athletic_potential_score', 'college_production_score', 'nfl_production_score']
-            ].mean().to_dict()
+            pos_avg = get_position_averages(filtered_df).loc[player_data['position']].to_dict()
             
-            radar_fig = create_radar_chart(player_data.to_dict(), pos_avg)
+            radar_fig = create_radar_chart(player_data, pos_avg)
             st.plotly_chart(radar_fig, use_container_width=True)
         
         with col_scores:
             st.markdown("### Scores & Rankings")
             
+            # Display strings are formatted once in load_rankings_data
             scores_data = [
-                ("RAS", f"{player_data.get('RAS', 'N/A'):.2f}" if pd.notna(player_data.get('RAS')) else "N/A", "—"),
-                ("Athletic Potential", f"{player_data.get('athletic_potential_score', 'N/A'):.1f}" if pd.notna(player_data.get('athletic_potential_score')) else "N/A", 
-                 f"#{int(player_data.get('athletic_potential_rank', 0))}" if pd.notna(player_data.get('athletic_potential_rank')) else "—"),
-                ("College Production", f"{player_data.get('college_production_score', 'N/A'):.1f}" if pd.notna(player_data.get('college_production_score')) else "N/A",
-                 f"#{int(player_data.get('college_production_rank', 0))}" if pd.notna(player_data.get('college_production_rank')) else "—"),
-                ("NFL Production", f"{player_data.get('nfl_production_score', 'N/A'):.1f}" if pd.notna(player_data.get('nfl_production_score')) else "N/A",
-                 f"#{int(player_data.get('nfl_production_rank', 0))}" if pd.notna(player_data.get('nfl_production_rank')) else "—"),
-                ("Composite", f"{player_data.get('composite_score', 'N/A'):.1f}" if pd.notna(player_data.get('composite_score')) else "N/A",
-                 f"#{int(player_data.get('composite_rank', 0))}" if pd.notna(player_data.get('composite_rank')) else "—"),
+                ("RAS", player_data['RAS_display'], "—"),
+                ("Athletic Potential", player_data['athletic_potential_score_display'], player_data['athletic_potential_rank_display']),
+                ("College Production", player_data['college_production_score_display'], player_data['college_production_rank_display']),
+                ("NFL Production", player_data['nfl_production_score_display'], player_data['nfl_production_rank_display']),
+                ("Composite", player_data['composite_score_display'], player_data['composite_rank_display']),
             ]
             
             for metric, score, rank in scores_data:
@@ -736,19 +1058,22 @@ with tab2:
                 with col_r:
                     st.markdown(f"{rank}")
 
+with tab2:
+    if tab2.open:
+        _render_profile(filtered_view)
+
 # ============================================================================
 # TAB 3: COMPARE
 # ============================================================================
 
-with tab3:
+@st.fragment
+def _render_compare(filtered_view):
+    """Render the Compare tab"""
     st.markdown("## Player Comparison")
     st.markdown("Compare 2-5 players side-by-side")
     
     # Multi-select players
-    compare_options = [
-        f"{row['position']} - {row['player_display_name']}" 
-        for _, row in filtered_df.sort_values(['position', 'player_display_name']).iterrows()
-    ]
+    compare_options, label_to_name = build_player_options(filtered_view.select(['position', 'player_display_name']))
     
     selected_players = st.multiselect(
         "Select Players to Compare",
@@ -761,104 +1086,108 @@ with tab3:
         st.info("👆 Select at least 2 players to compare")
     else:
         # Get selected player data
-        selected_names = [s.split(" - ", 1)[1] for s in selected_players]
-        compare_df = filtered_df[filtered_df['player_display_name'].isin(selected_names)].copy()
+        selected_names = [label_to_name[s] for s in selected_players]
+        name_index, name_rows = get_name_index(filtered_view.select(['player_display_name']))
+        hits = name_index.get_indexer(selected_names)
+        # Keep the filtered row order, as the old isin() mask did; take() reads
+        # the few rows straight from the base frame (no filtered copy)
+        compare_rows = np.sort(name_rows[hits[hits >= 0]])
+        compare_df = filtered_view.take(compare_rows)
         
         # Headshots row
         st.markdown("### Selected Players")
         cols = st.columns(len(compare_df))
         
-        for idx, (_, player) in enumerate(compare_df.iterrows()):
+        names = column_values(compare_df, 'player_display_name')
+        positions = column_values(compare_df, 'position')
+        clubs = column_values(compare_df, 'draft_club_name', na_value='N/A')
+        headshots = column_values(compare_df, 'headshot_url')
+        pillar_scores = np.column_stack([
+            compare_df[col].to_numpy(dtype=float) if col in compare_df.columns else np.zeros(len(compare_df))
+            for col in ['athletic_potential_score', 'college_production_score', 'nfl_production_score']
+        ])
+        # Repeat the first pillar to close each player's polygon
+        radar_values = np.hstack([pillar_scores, pillar_scores[:, :1]])
+        
+        categories = ['Athletic<br>Potential', 'College<br>Production', 'NFL<br>Production']
+        theta = categories + [categories[0]]
+        
+        # One pass over the players renders the headshot row and collects the
+        # overlay radar traces (one per player keeps each player's color and
+        # legend entry; at most 5 players)
+        overlay_traces = []
+        for idx in range(len(compare_df)):
             with cols[idx]:
-                if pd.notna(player.get('headshot_url')):
-                    st.image(player['headshot_url'], width=100)
+                if headshots[idx] is not None:
+                    # URLs are handed to the browser as-is (and HTTP-cached
+                    # there); the server never downloads the headshot
+                    st.image(headshots[idx], width=100)
                 else:
                     st.markdown("### 👤")
-                st.markdown(f"**{player['player_display_name']}**")
-                st.caption(f"{player['position']} | {player.get('draft_club_name', 'N/A')}")
+                st.markdown(f"**{names[idx]}**")
+                st.caption(f"{positions[idx]} | {clubs[idx]}")
+            
+            overlay_traces.append(go.Scatterpolar(
+                r=radar_values[idx],
+                theta=theta,
+                fill='toself',
+                name=names[idx],
+                opacity=0.5
+            ))
         
         st.markdown("---")
         
         # Comparison table
         st.markdown("### Comparison Table")
-        st.caption("🟢 Green = Best value")
-        
-        # Build comparison data
-        metrics = [
-            ('RAS', 'RAS', True),
-            ('Athletic Score', 'athletic_potential_score', True),
-            ('Athletic Rank', 'athletic_potential_rank', False),
-            ('College Score', 'college_production_score', True),
-            ('College Rank', 'college_production_rank', False),
-            ('NFL Score', 'nfl_production_score', True),
-            ('NFL Rank', 'nfl_production_rank', False),
-            ('Composite Score', 'composite_score', True),
-            ('Composite Rank', 'composite_rank', False),
-            ('Category', 'player_category', None),
-        ]
-        
-        comparison_data = []
-        metrics_config = {}
+        st.caption("🟢 = Best value")
         
-        for metric_name, col_name, higher_better in metrics:
-            row = {'Metric': metric_name}
-            for _, player in compare_df.iterrows():
-                val = player.get(col_name)
-                if pd.isna(val):
-                    row[player['player_display_name']] = 'N/A'
-                elif isinstance(val, float):
-                    if 'Rank' in metric_name:
-                        row[player['player_display_name']] = f"#{int(val)}"
-                    else:
-                        row[player['player_display_name']] = f"{val:.1f}"
-                else:
-                    row[player['player_display_name']] = str(val)
-            
-            comparison_data.append(row)
-            if higher_better is not None:
-                metrics_config[metric_name] = higher_better
-        
-        comparison_df = pd.DataFrame(comparison_data)
-        styled_df = style_comparison_table(comparison_df, metrics_config)
-        st.dataframe(styled_df, use_container_width=True, hide_index=True)
+        # Metric strings are formatted once per filter in build_comparison_display;
+        # each compared player's row becomes one column (one row per metric)
+        comparison_display = build_comparison_display(filtered_view.select(COMPARISON_COLUMNS))
+        comparison_columns = {'Metric': comparison_display.columns.to_numpy()}
+        for name, values in zip(comparison_display.index[compare_rows], comparison_display.to_numpy()[compare_rows]):
+            comparison_columns[name] = values
+        comparison_df = pd.DataFrame(comparison_columns, copy=False)
+        # Native grid with plain-string markers instead of Styler HTML
+        marked_df = mark_comparison_table(comparison_df, COMPARISON_METRICS_CONFIG)
+        st.dataframe(
+            marked_df,
+            column_config={
+                name: st.column_config.TextColumn(name) for name in marked_df.columns
+            },
+            use_container_width=True,
+            hide_index=True
+        )
         
         # Overlay radar chart
         st.markdown("---")
         st.markdown("### Performance Overlay")
         
-        overlay_fig = go.Figure()
-        
-        categories = ['Athletic<br>Potential', 'College<br>Production', 'NFL<br>Production']
-        
-        for _, player in compare_df.iterrows():
-            values = [
-                player.get('athletic_potential_score', 0) or 0,
-                player.get('college_production_score', 0) or 0,
-                player.get('nfl_production_score', 0) or 0
-            ]
-            values.append(values[0])
-            
-            overlay_fig.add_trace(go.Scatterpolar(
-                r=values,
-                theta=categories + [categories[0]],
-                fill='toself',
-                name=player['player_display_name'],
-                opacity=0.5
-            ))
-        
-        overlay_fig.update_layout(
-            polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
-            showlegend=True,
-            height=400
+        overlay_fig = go.Figure(
+            data=overlay_traces,
+            layout=dict(
+                polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
+                showlegend=True,
+                height=400
+            )
         )
         
         st.plotly_chart(overlay_fig, use_container_width=True)
 
+with tab3:
+    if tab3.open:
+        _render_compare(filtered_view)
+
 # ============================================================================
 # TAB 4: RANKINGS TABLE
 # ============================================================================
 
-with tab4:
+@st.fragment
+def _render_rankings_table(filtered_view):
+    """Render the Rankings Table tab"""
+    # Sort, export and render only the source columns (not the derived
+    # *_display helpers), so every pass over the table moves fewer columns
+    table_df = filtered_view.select(RANKINGS_COLUMNS)
     st.markdown("## Full Rankings Table")
     
     # Additional filters for this tab
@@ -885,33 +1214,39 @@ with tab4:
     }
     sort_col, ascending = sort_map[sort_by]
     
-    sorted_df = filtered_df.sort_values(sort_col, ascending=ascending)
+    sorted_df, table_key = sort_rankings(table_df, sort_col, ascending)
     
     # Export button
     if export_format == "CSV":
-        csv = sorted_df.to_csv(index=False)
         st.download_button(
             label="📥 Download CSV",
-            data=csv,
+            data=export_to_csv(table_key, sorted_df),
             file_name="secondary_rankings.csv",
             mime="text/csv"
         )
     else:
-        # PDF export (simplified HTML)
-        html_table = sorted_df.to_html(index=False)
+        # The export is only generated when the button is clicked; repeat
+        # downloads of the same view come from the cache
+        if get_pdf_renderer() is not None:
+            label, file_name, mime = "📥 Download PDF", "secondary_rankings.pdf", "application/pdf"
+        else:
+            label, file_name, mime = "📥 Download PDF (HTML)", "secondary_rankings.html", "text/html"
         st.download_button(
-            label="📥 Download PDF (HTML)",
-            data=html_table,
-            file_name="secondary_rankings.html",
-            mime="text/html"
+            label=label,
+            data=lambda: export_to_pdf(table_key, sorted_df),
+            file_name=file_name,
+            mime=mime,
+            on_click="ignore"
         )
     
     st.markdown("---")
     
     # Display Great Table
     try:
-        great_table = create_great_table(sorted_df)
-        st.markdown(great_table.as_raw_html(), unsafe_allow_html=True)
+        # create_great_table applies its own category/rank ordering, so the
+        # render is keyed on the filtered rows and shared by every sort option
+        gt_key = pd.util.hash_pandas_object(table_df, index=False).values.tobytes()
+        st.markdown(render_great_table_html(gt_key, table_df), unsafe_allow_html=True)
     except Exception as e:
         st.warning(f"Great Tables rendering issue: {e}")
         st.markdown("### Fallback Table")
@@ -920,262 +1255,800 @@ with tab4:
         display_cols = [c for c in display_cols if c in sorted_df.columns]
         st.dataframe(sorted_df[display_cols], use_container_width=True, hide_index=True)
 
+with tab4:
+    if tab4.open:
+        _render_rankings_table(filtered_view)
+
 # ============================================================================
 # TAB 5: PLAYER TRACKING
 # ============================================================================
 
-with tab5:
-    st.markdown("## Player Tracking")
-    st.markdown("Visualize player movement and performance metrics")
+# ----------------------------------------------------------------------------
+# LAZY LOADING FUNCTION - Load tracking data for single player on demand
+# ----------------------------------------------------------------------------
+# Columns the tracking tab reads (play id spelling varies by extract)
+TRACKING_COLUMNS = [
+    'gsis_id', 'game_id', 'gameId', 'play_id', 'playId', 'ts', 'x', 'y', 's', 'a', 'dis', 'dir', 'o'
+]
+TRACKING_CHUNK_ROWS = 200_000
+
+def get_play_key_columns(columns):
+    """The columns identifying a play: [game, play] when the extract has a game id
+    (play ids are only unique within a game), else [play], or [] without a play column"""
+    play_col = next((c for c in ('play_id', 'playId') if c in columns), None)
+    if play_col is None:
+        return []
+    game_col = next((c for c in ('game_id', 'gameId') if c in columns), None)
+    return [game_col, play_col] if game_col is not None else [play_col]
+
+# Per-frame numeric columns kept as flat float32 arrays in TrackData
+TRACK_FLOAT_COLUMNS = ('x', 'y', 's', 'a', 'dis', 'dir', 'o')
+
+# Yards per second -> miles per hour; the float32 copy keeps the speed arrays float32
+MPH_PER_YPS = 2.045
+MPH_PER_YPS_F32 = np.float32(MPH_PER_YPS)
+
+@dataclass(eq=False)
+class TrackData:
+    """One player's tracking frames as flat arrays (NaN / NaT where a value or column is missing)"""
+    x: np.ndarray
+    y: np.ndarray
+    s: np.ndarray
+    a: np.ndarray
+    dis: np.ndarray
+    dir: np.ndarray
+    o: np.ndarray
+    s_mph: np.ndarray  # s in MPH, converted once at load
+    ts: np.ndarray
+    ts_label: np.ndarray  # 'HH:MM:SS.mmm' strings for the frame viewer (None for NaT)
+    valid: dict  # column -> bool array, True where the frame has a value
+    load_id: int = 0  # tells one load of the data from the next, for cache keys
+    
+    @classmethod
+    def from_frame(cls, df, load_id=0):
+        """Pull the tracking columns out of df once, in frame order"""
+        n = len(df)
+        floats = {
+            col: (df[col].to_numpy(dtype=np.float32, na_value=np.nan)
+                  if col in df.columns else np.full(n, np.nan, dtype=np.float32))
+            for col in TRACK_FLOAT_COLUMNS
+        }
+        if 'ts' in df.columns:
+            ts = df['ts'].to_numpy(dtype='datetime64[ns]')
+        else:
+            ts = np.full(n, np.datetime64('NaT'), dtype='datetime64[ns]')
+        # Format every timestamp once here instead of on each slider tick
+        ts_label = pd.Series(ts).dt.strftime('%H:%M:%S.%f').str[:-3]
+        # Validity masks built once so the frame viewer doesn't test NaN per value
+        valid = {col: ~np.isnan(values) for col, values in floats.items()}
+        valid['s_mph'] = valid['s']
+        valid['ts'] = ~np.isnat(ts)
+        return cls(
+            s_mph=floats['s'] * MPH_PER_YPS_F32, ts=ts,
+            ts_label=ts_label.to_numpy(dtype=object, na_value=None), valid=valid,
+            load_id=load_id, **floats
+        )
     
-    # -------------------------------------------------------------------------
-    # LAZY LOADING FUNCTION - Load tracking data for single player on demand
-    # -------------------------------------------------------------------------
-    @st.cache_data(ttl=600)  # Cache for 10 minutes
-    def load_player_tracking(gsis_id):
-        """Load tracking data for a single player (lazy loading)"""
-        try:
-            import dataiku
-            dataset = dataiku.Dataset("game_data_24_secondary_all")
-            
-            # Load full dataset and filter (Dataiku handles optimization)
-            # For very large datasets, consider using dataset.iter_dataframes()
-            df = dataset.get_dataframe()
-            df = df[df['gsis_id'] == gsis_id].copy()
-            
-            if 'ts' in df.columns:
-                df['ts'] = pd.to_datetime(df['ts'])
-                df = df.sort_values('ts')
-            
-            return df
-        except Exception as e:
-            st.error(f"Error loading tracking data: {e}")
-            return pd.DataFrame()
-    
-    # -------------------------------------------------------------------------
-    # HELPER FUNCTIONS
-    # -------------------------------------------------------------------------
-    def calculate_tracking_stats(player_tracking_df):
-        """Calculate summary statistics from tracking data"""
-        if player_tracking_df.empty:
-            return {}
-        
-        stats = {}
-        
-        # Speed stats (convert yards/sec to MPH: multiply by 2.045)
-        if 's' in player_tracking_df.columns:
-            speeds = player_tracking_df['s'].dropna()
-            if len(speeds) > 0:
-                stats['max_speed_mph'] = speeds.max() * 2.045
-                stats['avg_speed_mph'] = speeds.mean() * 2.045
-                stats['min_speed_mph'] = speeds.min() * 2.045
-        
-        # Acceleration stats
-        if 'a' in player_tracking_df.columns:
-            accels = player_tracking_df['a'].dropna()
-            if len(accels) > 0:
-                stats['max_acceleration'] = accels.max()
-                stats['avg_acceleration'] = accels.mean()
-        
-        # Distance stats
-        if 'dis' in player_tracking_df.columns:
-            distances = player_tracking_df['dis'].dropna()
-            if len(distances) > 0:
-                stats['total_distance'] = distances.sum()
-                stats['avg_distance_per_frame'] = distances.mean()
-        
-        # Frame/time stats
-        stats['total_frames'] = len(player_tracking_df)
-        
-        if 'ts' in player_tracking_df.columns:
-            ts = player_tracking_df['ts'].dropna()
-            if len(ts) > 1:
-                time_range = (ts.max() - ts.min()).total_seconds()
-                stats['total_time_seconds'] = time_range
-        
-        # Play count (unique play identifiers if available)
-        if 'play_id' in player_tracking_df.columns:
-            stats['play_count'] = player_tracking_df['play_id'].nunique()
-        elif 'playId' in player_tracking_df.columns:
-            stats['play_count'] = player_tracking_df['playId'].nunique()
+    def __len__(self):
+        return len(self.ts)
+    
+    def subset(self, rows):
+        """Frames selected by a boolean mask, positions or a slice"""
+        return TrackData(
+            s_mph=self.s_mph[rows], ts=self.ts[rows], ts_label=self.ts_label[rows], load_id=self.load_id,
+            valid={col: mask[rows] for col, mask in self.valid.items()},
+            **{col: getattr(self, col)[rows] for col in TRACK_FLOAT_COLUMNS}
+        )
+
+@st.cache_data(ttl=600)  # Cache for 10 minutes
+def load_player_tracking(gsis_id):
+    """Load tracking data for a single player (lazy loading)
+    
+    Returns (frame, TrackData, play_slices). Frames are in timestamp order;
+    play_slices maps each play (its play id, or a (game id, play id) tuple when
+    the extract has a game column) to the positions of its frames, in order
+    (empty when the data has no play column).
+    """
+    try:
+        import dataiku
+        dataset = dataiku.Dataset("game_data_24_secondary_all")
         
-        # Direction changes (significant changes > 45 degrees)
-        if 'dir' in player_tracking_df.columns:
-            dirs = player_tracking_df['dir'].dropna()
-            if len(dirs) > 1:
-                dir_changes = dirs.diff().abs()
-                # Account for 360-degree wraparound
-                dir_changes = dir_changes.apply(lambda x: min(x, 360 - x) if pd.notna(x) else 0)
-                significant_changes = (dir_changes > 45).sum()
-                stats['direction_changes'] = significant_changes
+        # Stream the dataset in chunks, reading only the columns we use and
+        # keeping only this player's rows, so the full table is never in memory
+        available = {c['name'] for c in dataset.read_schema()}
+        columns = [c for c in TRACKING_COLUMNS if c in available]
+        chunks = [
+            chunk[chunk['gsis_id'] == gsis_id]
+            for chunk in dataset.iter_dataframes(chunksize=TRACKING_CHUNK_ROWS, columns=columns)
+        ]
+        df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=columns)
         
-        return stats
-    
-    def create_field_figure():
-        """Create base football field figure"""
-        fig = go.Figure()
+        # Tracking values only carry a couple of decimals, so float32 is plenty
+        # and halves the memory behind every downstream array and chart payload
+        float_cols = [c for c in TRACK_FLOAT_COLUMNS if c in df.columns]
+        df[float_cols] = df[float_cols].astype(np.float32)
         
-        # Field background
-        fig.add_shape(
-            type="rect", x0=0, y0=0, x1=120, y1=53.3,
-            fillcolor="#2e7d32", line=dict(color="white", width=2)
-        )
+        # A player has one id and a few dozen plays across thousands of frames, so
+        # the id columns are stored as category codes (play grouping runs on the codes)
+        play_key_cols = get_play_key_columns(df.columns)
+        id_cols = [c for c in ['gsis_id'] + play_key_cols if c in df.columns]
+        df[id_cols] = df[id_cols].astype('category')
         
-        # End zones
-        fig.add_shape(
-            type="rect", x0=0, y0=0, x1=10, y1=53.3,
-            fillcolor="#1b5e20", line=dict(color="white", width=1)
-        )
-        fig.add_shape(
-            type="rect", x0=110, y0=0, x1=120, y1=53.3,
-            fillcolor="#1b5e20", line=dict(color="white", width=1)
-        )
+        if 'ts' in df.columns:
+            df['ts'] = pd.to_datetime(df['ts'])
+            try:
+                import pyarrow as pa
+                df['ts'] = df['ts'].astype(pd.ArrowDtype(pa.timestamp('ns')))
+            except ImportError:
+                pass
         
-        # Yard lines (every 10 yards)
-        for yard in range(10, 111, 10):
-            fig.add_shape(
-                type="line", x0=yard, y0=0, x1=yard, y1=53.3,
-                line=dict(color="white", width=1)
-            )
+        if 'ts' in df.columns:
+            df = df.sort_values('ts', kind='stable', ignore_index=True)
         
-        # Yard line labels
-        for yard in range(10, 51, 10):
-            # Left side numbers
-            fig.add_annotation(
-                x=yard + 10, y=5, text=str(yard),
-                showarrow=False, font=dict(color="white", size=12)
-            )
-            fig.add_annotation(
-                x=yard + 10, y=48.3, text=str(yard),
-                showarrow=False, font=dict(color="white", size=12)
+        # Group frame positions by play with one stable argsort of the play codes,
+        # so each play's positions stay in timestamp order
+        play_slices = {}
+        if play_key_cols:
+            play_key = (
+                df[play_key_cols[0]] if len(play_key_cols) == 1
+                else pd.MultiIndex.from_frame(df[play_key_cols])
             )
-            # Right side numbers (mirrored)
-            if yard < 50:
-                fig.add_annotation(
-                    x=110 - yard, y=5, text=str(yard),
-                    showarrow=False, font=dict(color="white", size=12)
-                )
-                fig.add_annotation(
-                    x=110 - yard, y=48.3, text=str(yard),
-                    showarrow=False, font=dict(color="white", size=12)
-                )
+            codes, play_ids = pd.factorize(play_key, sort=True, use_na_sentinel=False)
+            order = np.argsort(codes, kind='stable')
+            bounds = np.flatnonzero(np.diff(codes[order])) + 1
+            play_slices = dict(zip(play_ids.tolist(), np.split(order, bounds)))
         
-        # Hash marks (simplified)
-        for yard in range(10, 111, 1):
-            # Top hash
-            fig.add_shape(
-                type="line", x0=yard, y0=23.6, x1=yard, y1=24.6,
-                line=dict(color="white", width=0.5)
-            )
-            # Bottom hash
-            fig.add_shape(
-                type="line", x0=yard, y0=28.7, x1=yard, y1=29.7,
-                line=dict(color="white", width=0.5)
-            )
+        # Stamped per load, so per-play caches built from an expired load aren't reused
+        return df, TrackData.from_frame(df, load_id=time.time_ns()), play_slices
+    except Exception as e:
+        st.error(f"Error loading tracking data: {e}")
+        empty = pd.DataFrame()
+        return empty, TrackData.from_frame(empty), {}
+
+# ----------------------------------------------------------------------------
+# HELPER FUNCTIONS
+# ----------------------------------------------------------------------------
+@st.cache_data(ttl=600, max_entries=32, show_spinner=False)
+def calculate_tracking_stats(gsis_id, play_key, load_id, _player_tracking_df):
+    """Calculate summary statistics from tracking data for one player and play (None = all plays)
+    
+    load_id is the TrackData.load_id of the load the frame came from, so a
+    reload is never answered with stats from the previous one.
+    """
+    player_tracking_df = _player_tracking_df
+    if player_tracking_df.empty:
+        return {}
+    
+    stats = {}
+    
+    # One fused pass over the float32 columns as loaded, no float64 copies (missing
+    # columns count as all-NaN); the kernel accumulates sums in float64
+    n_frames = len(player_tracking_df)
+    s, a, dis, dir_ = (
+        player_tracking_df[col].to_numpy(dtype=np.float32, na_value=np.nan)
+        if col in player_tracking_df.columns else np.full(n_frames, np.nan, dtype=np.float32)
+        for col in ('s', 'a', 'dis', 'dir')
+    )
+    (s_count, s_max, s_sum, s_min, a_count, a_max, a_sum,
+     dis_count, dis_sum, dir_count, dir_changes) = summarize_tracking(s, a, dis, dir_)
+    
+    # Speed stats (convert yards/sec to MPH)
+    if s_count > 0:
+        stats['max_speed_mph'] = s_max * MPH_PER_YPS
+        stats['avg_speed_mph'] = s_sum / s_count * MPH_PER_YPS
+        stats['min_speed_mph'] = s_min * MPH_PER_YPS
+    
+    # Acceleration stats
+    if a_count > 0:
+        stats['max_acceleration'] = a_max
+        stats['avg_acceleration'] = a_sum / a_count
+    
+    # Distance stats
+    if dis_count > 0:
+        stats['total_distance'] = dis_sum
+        stats['avg_distance_per_frame'] = dis_sum / dis_count
+    
+    # Frame/time stats
+    stats['total_frames'] = n_frames
+    
+    if 'ts' in player_tracking_df.columns:
+        ts = player_tracking_df['ts'].dropna()
+        if len(ts) > 1:
+            time_range = (ts.max() - ts.min()).total_seconds()
+            stats['total_time_seconds'] = time_range
+    
+    # Play count (unique play identifiers, per game when available)
+    play_key_cols = get_play_key_columns(player_tracking_df.columns)
+    if play_key_cols:
+        stats['play_count'] = len(player_tracking_df[play_key_cols].dropna().drop_duplicates())
+    
+    # Direction changes (significant changes > 45 degrees)
+    if dir_count > 1:
+        stats['direction_changes'] = dir_changes
+    
+    return stats
+
+@st.cache_data(ttl=600, max_entries=32, show_spinner=False)
+def get_detailed_tracking_stats(gsis_id, load_id, _player_tracking_df):
+    """Formatted Detailed Statistics rows for a player's full session (load_id:
+    the TrackData.load_id of the load the frame came from)
+    
+    Returns (speed_stats, activity_stats) as Metric-indexed, one-column tables,
+    so reruns from unrelated widgets (view toggles, play changes) skip the
+    formatting too.
+    """
+    stats = calculate_tracking_stats(gsis_id, None, load_id, _player_tracking_df)
+    speed_stats = {
+        "Max Speed (MPH)": f"{stats.get('max_speed_mph', 0):.2f}",
+        "Avg Speed (MPH)": f"{stats.get('avg_speed_mph', 0):.2f}",
+        "Min Speed (MPH)": f"{stats.get('min_speed_mph', 0):.2f}",
+        "Max Acceleration (yds/s²)": f"{stats.get('max_acceleration', 0):.2f}",
+        "Avg Acceleration (yds/s²)": f"{stats.get('avg_acceleration', 0):.2f}",
+    }
+    activity_stats = {
+        "Total Distance (yds)": f"{stats.get('total_distance', 0):.1f}",
+        "Total Frames": f"{stats.get('total_frames', 0):,}",
+        "Direction Changes (>45°)": f"{stats.get('direction_changes', 0):,}",
+    }
+    if 'play_count' in stats:
+        activity_stats["Plays Tracked"] = f"{stats.get('play_count', 0)}"
+    if 'total_time_seconds' in stats:
+        activity_stats["Total Time (sec)"] = f"{stats.get('total_time_seconds', 0):.1f}"
+    return tuple(
+        pd.DataFrame(list(rows.items()), columns=['Metric', 'Value']).set_index('Metric')
+        for rows in (speed_stats, activity_stats)
+    )
+
+# Raw-data preview columns, after the play column
+TRACKING_PREVIEW_COLUMNS = ('ts', 'x', 'y', 's', 'a', 'dis', 'dir', 'o')
+
+def get_tracking_columns(columns):
+    """The tracking columns present in columns, in raw-preview order (game and play columns first)
+    
+    Computed once per run from the loaded frame's schema; the tab's column checks
+    are tuple lookups after that.
+    """
+    return tuple(get_play_key_columns(columns)) + tuple(c for c in TRACKING_PREVIEW_COLUMNS if c in columns)
+
+# Field axes are fixed, so the zoom/pan toolbar and gestures only add client work
+TRACKING_CHART_CONFIG = {'displayModeBar': False, 'scrollZoom': False, 'doubleClick': False}
+# The frame viewer and speed distribution are read-only pictures (the frame metrics
+# already show the hover values), so they skip Plotly's event handlers and hit-testing
+TRACKING_STATIC_CHART_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+
+@st.cache_resource
+def get_field_template():
+    """Build the static field layout once per process, as a plain figure dict"""
+    fig = go.Figure()
+    
+    # Yard line labels: left side numbers, then the mirrored right side (one 50)
+    annotations = [
+        dict(x=x, y=y, text=str(yard), showarrow=False, font=dict(color="white", size=12))
+        for yard in range(10, 51, 10)
+        for x in ((yard + 10, 110 - yard) if yard < 50 else (yard + 10,))
+        for y in (5, 48.3)
+    ]
+    
+    # Field background and end zones
+    shapes = [
+        dict(type="rect", x0=0, y0=0, x1=120, y1=53.3,
+             fillcolor="#2e7d32", line=dict(color="white", width=2)),
+        dict(type="rect", x0=0, y0=0, x1=10, y1=53.3,
+             fillcolor="#1b5e20", line=dict(color="white", width=1)),
+        dict(type="rect", x0=110, y0=0, x1=120, y1=53.3,
+             fillcolor="#1b5e20", line=dict(color="white", width=1)),
+    ]
+    
+    # Yard lines (every 10 yards)
+    shapes += [
+        dict(type="line", x0=yard, y0=0, x1=yard, y1=53.3,
+             line=dict(color="white", width=1))
+        for yard in range(10, 111, 10)
+    ]
+    
+    # Hash marks (simplified): top then bottom hash at each yard
+    shapes += [
+        dict(type="line", x0=yard, y0=y0, x1=yard, y1=y1,
+             line=dict(color="white", width=0.5))
+        for yard in range(10, 111, 1)
+        for y0, y1 in ((23.6, 24.6), (28.7, 29.7))
+    ]
+    
+    # One layout assignment instead of an add_shape / add_annotation call per item
+    fig.update_layout(
+        shapes=shapes,
+        annotations=annotations,
+        xaxis=dict(
+            range=[-5, 125], showgrid=False, zeroline=False,
+            showticklabels=False, fixedrange=True
+        ),
+        yaxis=dict(
+            range=[-5, 58.3], showgrid=False, zeroline=False,
+            showticklabels=False, fixedrange=True,
+            scaleanchor="x", scaleratio=1
+        ),
+        height=500,
+        margin=dict(l=20, r=20, t=40, b=20),
+        plot_bgcolor='#2e7d32',
+        # Hover picks the nearest point only, with no spike-line search
+        hovermode='closest',
+        spikedistance=0,
+        # Keep the client's view state across reruns instead of resetting the plot
+        uirevision='tracking'
+    )
+    
+    return fig.to_dict()
+
+def create_field_figure():
+    """Create base football field figure"""
+    # Callers add traces and titles, so each one gets its own copy of the template
+    return go.Figure(copy.deepcopy(get_field_template()))
+
+# Most points a movement path trace sends to the browser
+TRACKING_PATH_MAX_POINTS = 2500
+
+def add_player_path_to_field(fig, track, color_by_speed=True):
+    """Add player movement path (a TrackData, in frame order) to field figure"""
+    if len(track) == 0:
+        return fig
+    
+    x_coords = track.x
+    y_coords = track.y
+    
+    # Long sessions are downsampled for display only; stats use the full frame
+    keep = lttb_indices(x_coords, y_coords, TRACKING_PATH_MAX_POINTS)
+    x_coords, y_coords = x_coords[keep], y_coords[keep]
+    
+    # WebGL traces: one GPU draw for the path instead of an SVG node per point
+    if color_by_speed:
+        speeds = track.s[keep]
         
-        fig.update_layout(
-            xaxis=dict(
-                range=[-5, 125], showgrid=False, zeroline=False,
-                showticklabels=False, fixedrange=True
+        # Create color scale based on speed
+        fig.add_trace(go.Scattergl(
+            x=x_coords,
+            y=y_coords,
+            mode='lines+markers',
+            line=dict(width=3, color='rgba(255,255,255,0.3)'),
+            marker=dict(
+                size=6,
+                color=speeds,
+                colorscale='YlOrRd',  # Yellow to Red (slow to fast)
+                colorbar=dict(
+                    title="Speed<br>(yds/s)",
+                    x=1.02,
+                    len=0.5
+                ),
+                showscale=True
             ),
-            yaxis=dict(
-                range=[-5, 58.3], showgrid=False, zeroline=False,
-                showticklabels=False, fixedrange=True,
-                scaleanchor="x", scaleratio=1
+            hovertemplate=(
+                '<b>Position</b><br>'
+                'X: %{x:.1f} yds<br>'
+                'Y: %{y:.1f} yds<br>'
+                'Speed: %{marker.color:.1f} yds/s<br>'
+                '<extra></extra>'
             ),
-            height=500,
-            margin=dict(l=20, r=20, t=40, b=20),
-            plot_bgcolor='#2e7d32'
+            name='Movement Path'
+        ))
+    else:
+        # Simple path without speed coloring
+        fig.add_trace(go.Scattergl(
+            x=x_coords,
+            y=y_coords,
+            mode='lines+markers',
+            line=dict(width=3, color='yellow'),
+            marker=dict(size=6, color='yellow'),
+            name='Movement Path'
+        ))
+    
+    # Start (green circle) and end (red square) markers share one trace
+    if len(x_coords) > 0:
+        fig.add_trace(go.Scattergl(
+            x=x_coords[[0, -1]], y=y_coords[[0, -1]],
+            mode='markers',
+            marker=dict(size=15, color=['lime', 'red'], symbol=['circle', 'square'],
+                       line=dict(color='white', width=2)),
+            text=['START', 'END'],
+            name='Start / End',
+            hovertemplate='<b>%{text}</b><br>X: %{x:.1f}<br>Y: %{y:.1f}<extra></extra>'
+        ))
+    
+    return fig
+
+# Heat-map grid over the full field (x: 0-120 yds, y: 0-53.3 yds)
+TRACKING_HEAT_BINS = (40, 20)
+TRACKING_HEAT_RANGE = ((0, 120), (0, 53.3))
+
+@st.cache_data(ttl=600, max_entries=32, show_spinner=False)
+def get_heat_map_grid(gsis_id, play_key, load_id, _x, _y):
+    """Frame counts per field bin for one player and play (None = all plays), plus bin centres"""
+    counts, x_edges, y_edges = np.histogram2d(
+        _x, _y, bins=TRACKING_HEAT_BINS, range=TRACKING_HEAT_RANGE
+    )
+    # Heatmap rows are y, so transpose the (x, y) histogram
+    return counts.T, (x_edges[:-1] + x_edges[1:]) / 2, (y_edges[:-1] + y_edges[1:]) / 2
+
+@st.cache_data(ttl=600, max_entries=32, show_spinner=False)
+def get_zone_shares(gsis_id, play_key, load_id, _x, _y):
+    """Percent of frames on the left side, in the end zone areas and in the middle of the field"""
+    total = len(_x)
+    if total == 0:
+        return 0.0, 0.0, 0.0
+    # Left/Right, deep/short and middle-of-field counts in one pass
+    left_side, deep, middle = count_zones(_x, _y)
+    return left_side / total * 100, deep / total * 100, middle / total * 100
+
+TRACKING_SPEED_BINS = 30
+
+@st.cache_data(ttl=600, max_entries=32, show_spinner=False)
+def get_speed_histogram(gsis_id, play_key, load_id, _track):
+    """Speed Distribution for a player's play (None = all plays)
+    
+    Returns (counts, bin centers, bin widths, avg, max) in MPH, binned here so
+    only TRACKING_SPEED_BINS bars go to the browser instead of every frame's
+    speed; avg and max are None when no frame has a speed.
+    """
+    speeds_mph = _track.s_mph[_track.valid['s']]
+    counts, edges = np.histogram(speeds_mph, bins=TRACKING_SPEED_BINS)
+    # Avg and max from one fused pass over the same array
+    speed_count, _, max_speed, speed_sum = speed_range(speeds_mph)
+    if speed_count == 0:
+        return counts, (edges[:-1] + edges[1:]) / 2, np.diff(edges), None, None
+    return counts, (edges[:-1] + edges[1:]) / 2, np.diff(edges), speed_sum / speed_count, max_speed
+
+@st.cache_resource(ttl=600, max_entries=32, show_spinner=False)
+def get_frame_base_figure(gsis_id, play_key, load_id, _track):
+    """Frame-by-frame figure parts that don't move with the slider, as a figure dict
+    
+    The field plus the whole session as a faint dotted line (thinned on long
+    sessions); callers deep-copy it and add the path history and markers.
+    """
+    fig = create_field_figure()
+    
+    step = max(1, -(-len(_track) // TRACKING_PATH_MAX_POINTS))
+    fig.add_trace(go.Scattergl(
+        x=_track.x[::step],
+        y=_track.y[::step],
+        mode='lines',
+        line=dict(width=1, color='rgba(255,255,255,0.2)', dash='dot'),
+        name='Full Path',
+        hoverinfo='skip'
+    ))
+    fig.update_layout(
+        showlegend=True,
+        legend=dict(
+            yanchor="top", y=0.99,
+            xanchor="left", x=0.01,
+            bgcolor="rgba(0,0,0,0.5)",
+            font=dict(color="white")
         )
-        
-        return fig
+    )
+    return fig.to_dict()
+
+# Longest play the frame viewer offers as an in-browser animation (10 frames a second)
+TRACKING_ANIMATION_MAX_FRAMES = 500
+
+# Animations carry a Plotly frame and a slider step per tracking frame, and the
+# view is opt-in, so only a few are kept per process
+@st.cache_resource(ttl=600, max_entries=4, show_spinner=False)
+def get_frame_animation_figure(gsis_id, play_key, load_id, player_name, _track):
+    """The frame viewer as a Plotly animation for one player's play (None = all plays)
+    
+    Every frame's marker position ships with the figure as a Plotly frame, so the
+    Play/Pause buttons and the chart's own slider step through the play in the
+    browser with no script reruns. Returned as a figure dict; callers deep-copy
+    it into a go.Figure, as with get_frame_base_figure.
+    """
+    anim_fig = go.Figure(copy.deepcopy(get_frame_base_figure(gsis_id, play_key, load_id, _track)))
+    
+    speed_mph = np.where(_track.valid['s'], _track.s_mph, np.float32(0))
+    colors = np.where(speed_mph > 15, 'red', np.where(speed_mph > 10, 'yellow', 'lime'))
+    
+    # SVG rather than WebGL, so frames can move the marker without a full redraw
+    anim_fig.add_trace(go.Scatter(
+        x=_track.x[:1],
+        y=_track.y[:1],
+        mode='markers',
+        marker=dict(size=20, color=colors[0], line=dict(color='white', width=3)),
+        name=player_name,
+        hoverinfo='skip'
+    ))
+    marker_trace = len(anim_fig.data) - 1
+    anim_fig.frames = [
+        go.Frame(
+            data=[go.Scatter(x=_track.x[i:i + 1], y=_track.y[i:i + 1], marker=dict(color=colors[i]))],
+            traces=[marker_trace],
+            name=str(i)
+        )
+        for i in range(len(_track))
+    ]
     
-    def add_player_path_to_field(fig, tracking_df, color_by_speed=True):
-        """Add player movement path to field figure"""
-        if tracking_df.empty or 'x' not in tracking_df.columns or 'y' not in tracking_df.columns:
-            return fig
+    frame_args = dict(frame=dict(duration=100, redraw=False), mode='immediate', transition=dict(duration=0))
+    anim_fig.update_layout(
+        title=f"{player_name} - {len(_track)} frames",
+        updatemenus=[dict(
+            type='buttons',
+            direction='left',
+            showactive=False,
+            x=0, y=0, xanchor='left', yanchor='top',
+            buttons=[
+                dict(label='▶ Play', method='animate', args=[None, dict(frame_args, fromcurrent=True)]),
+                dict(label='⏸ Pause', method='animate', args=[[None], frame_args]),
+            ]
+        )],
+        sliders=[dict(
+            active=0,
+            x=0.15, len=0.85, y=0, yanchor='top',
+            currentvalue=dict(prefix='Frame '),
+            steps=[
+                dict(method='animate', label=str(i + 1), args=[[str(i)], frame_args])
+                for i in range(len(_track))
+            ]
+        )]
+    )
+    return anim_fig.to_dict()
+
+# Frame Details rows after the timestamp: (TrackData column, label, printf format)
+FRAME_DETAIL_FIELDS = (
+    ('x', 'X Position', '%.2f'),
+    ('y', 'Y Position', '%.2f'),
+    ('s', 'Speed (yds/s)', '%.2f'),
+    ('s_mph', 'Speed (MPH)', '%.2f'),
+    ('a', 'Acceleration', '%.3f'),
+    ('dis', 'Distance', '%.3f'),
+    ('dir', 'Direction (°)', '%.1f'),
+    ('o', 'Orientation (°)', '%.1f'),
+)
+
+@st.cache_resource(ttl=600, max_entries=32, show_spinner=False)
+def format_frame_details(gsis_id, play_key, load_id, _track):
+    """Frame Details markdown for every frame of a player's play (None = all plays)
+    
+    Formatted on the first Frame-by-Frame render of the play and shared from
+    there. Returns one markdown string per frame with a paragraph per detail
+    (timestamp first); details the frame has no value for are left out.
+    Cached as a resource so slider ticks don't unpickle it; callers must not
+    mutate it.
+    """
+    lines = np.full((len(_track), len(FRAME_DETAIL_FIELDS) + 1), None, dtype=object)
+    has_ts = _track.valid['ts']
+    lines[has_ts, 0] = [f"**Timestamp:** {pd.Timestamp(v)}" for v in _track.ts[has_ts]]
+    for j, (col, label, fmt) in enumerate(FRAME_DETAIL_FIELDS, start=1):
+        has_value = _track.valid[col]
+        values = getattr(_track, col)[has_value]
+        lines[has_value, j] = np.char.mod(f"**{label}:** {fmt}", values)
+    # Joined up front so the expander sends one markdown element per frame
+    return np.array(
+        ["\n\n".join(line for line in row if line is not None) for row in lines], dtype=object
+    )
+
+@st.cache_resource(ttl=600, max_entries=32, show_spinner=False)
+def format_frame_metrics(gsis_id, play_key, load_id, _track):
+    """Frame metric texts for every frame of a player's play (None = all plays)
+    
+    Maps 'x', 'y', 'speed' and 'accel' to one string per frame, with the
+    viewer's fallback text ("N/A", or 0.0 MPH for speed) where a value is missing.
+    Built and cached like format_frame_details; callers must not mutate it.
+    """
+    speed_mph = np.where(_track.valid['s'], _track.s_mph, np.float32(0))
+    return {
+        'x': np.where(_track.valid['x'], np.char.mod('%.1f yds', _track.x), 'N/A'),
+        'y': np.where(_track.valid['y'], np.char.mod('%.1f yds', _track.y), 'N/A'),
+        'speed': np.char.mod('%.1f MPH', speed_mph),
+        'accel': np.where(_track.valid['a'], np.char.mod('%.2f', _track.a), 'N/A'),
+    }
+
+@st.cache_resource
+def warm_up_tracking_kernels():
+    """Compile (or load from Numba's on-disk cache) the tracking kernels once per process"""
+    tracking_kernels.warm_up()
+
+def get_frame_figure(gsis_id, play_key, track):
+    """The frame-by-frame figure for one player's play (None = all plays)
+    
+    Built once per play and load of the data (track.load_id) and kept in session
+    state; each slider tick moves its path history, direction arrow and markers
+    in place (set_figure_frame) instead of constructing and validating a new figure.
+    """
+    view_key = (gsis_id, play_key, track.load_id)
+    frame_figure = st.session_state.get('frame_figure')
+    if frame_figure is not None and frame_figure[0] == view_key:
+        return frame_figure[1]
+    
+    # The cached field + full-path figure, plus the parts that follow the slider:
+    # path history and marker traces last, direction arrow as the last annotation
+    frame_fig = go.Figure(copy.deepcopy(get_frame_base_figure(gsis_id, play_key, track.load_id, track)))
+    frame_fig.add_trace(go.Scattergl(
+        x=[], y=[],
+        mode='lines',
+        line=dict(width=2, color='rgba(255,255,0,0.4)'),
+        name='Path History',
+        hoverinfo='skip',
+        visible=False
+    ))
+    frame_fig.add_trace(go.Scattergl(
+        x=[], y=[],
+        mode='markers',
+        marker=dict(symbol='circle', line=dict(color='white')),
+        name='Current / Start',
+        hovertemplate='%{text}<extra></extra>',
+        visible=False
+    ))
+    frame_fig.add_annotation(
+        x=0, y=0, ax=0, ay=0,
+        xref="x", yref="y",
+        axref="x", ayref="y",
+        showarrow=True,
+        arrowhead=2,
+        arrowsize=1.5,
+        arrowwidth=3,
+        arrowcolor="cyan",
+        visible=False
+    )
+    st.session_state['frame_figure'] = (view_key, frame_fig)
+    return frame_fig
+
+def set_figure_frame(frame_fig, track, frame, player_name):
+    """Point a get_frame_figure figure at one frame of its play"""
+    valid = {col: bool(mask[frame]) for col, mask in track.valid.items()}
+    x_val, y_val = track.x[frame], track.y[frame]
+    speed_mph = track.s_mph[frame] if valid['s'] else 0
+    history, markers = frame_fig.data[-2:]
+    arrow = frame_fig.layout.annotations[-1]
+    
+    marker_points = []
+    with frame_fig.batch_update():
+        # Path up to the current frame (faded)
+        history.update(x=track.x[:frame + 1], y=track.y[:frame + 1], visible=frame > 0)
         
-        # Sort by timestamp if available
-        if 'ts' in tracking_df.columns:
-            tracking_df = tracking_df.sort_values('ts')
+        # Direction arrow if available
+        if valid['x'] and valid['y'] and valid['dir']:
+            dir_rad = np.radians(track.dir[frame])
+            arrow_len = 3
+            arrow.update(
+                x=x_val, y=y_val,
+                ax=x_val + arrow_len * np.sin(dir_rad),
+                ay=y_val + arrow_len * np.cos(dir_rad),
+                visible=True
+            )
+        else:
+            arrow.visible = False
+        
+        # Player marker
+        if valid['x'] and valid['y']:
+            speed_color = 'red' if speed_mph > 15 else 'yellow' if speed_mph > 10 else 'lime'
+            marker_points.append((
+                x_val, y_val, 20, speed_color, 3,
+                f'<b>{player_name}</b><br>'
+                f'X: {x_val:.1f}<br>'
+                f'Y: {y_val:.1f}<br>'
+                f'Speed: {speed_mph:.1f} MPH'
+            ))
         
-        x_coords = tracking_df['x'].values
-        y_coords = tracking_df['y'].values
+        # Start marker
+        if track.valid['x'][0] and track.valid['y'][0]:
+            marker_points.append((track.x[0], track.y[0], 12, 'lime', 2, '<b>START</b>'))
         
-        if color_by_speed and 's' in tracking_df.columns:
-            speeds = tracking_df['s'].values
-            
-            # Create color scale based on speed
-            fig.add_trace(go.Scatter(
-                x=x_coords,
-                y=y_coords,
-                mode='lines+markers',
-                line=dict(width=3, color='rgba(255,255,255,0.3)'),
+        # Current position and start share one WebGL marker trace
+        if marker_points:
+            mx, my, sizes, colors, widths, labels = zip(*marker_points)
+            # NumPy arrays go out as typed (base64) arrays rather than JSON number lists
+            markers.update(
+                x=np.array(mx, dtype=np.float32),
+                y=np.array(my, dtype=np.float32),
                 marker=dict(
-                    size=6,
-                    color=speeds,
-                    colorscale='YlOrRd',  # Yellow to Red (slow to fast)
-                    colorbar=dict(
-                        title="Speed<br>(yds/s)",
-                        x=1.02,
-                        len=0.5
-                    ),
-                    showscale=True
-                ),
-                hovertemplate=(
-                    '<b>Position</b><br>'
-                    'X: %{x:.1f} yds<br>'
-                    'Y: %{y:.1f} yds<br>'
-                    'Speed: %{marker.color:.1f} yds/s<br>'
-                    '<extra></extra>'
+                    size=np.array(sizes, dtype=np.int8),
+                    color=colors,
+                    line=dict(width=np.array(widths, dtype=np.int8))
                 ),
-                name='Movement Path'
-            ))
+                text=labels,
+                visible=True
+            )
         else:
-            # Simple path without speed coloring
-            fig.add_trace(go.Scatter(
-                x=x_coords,
-                y=y_coords,
-                mode='lines+markers',
-                line=dict(width=3, color='yellow'),
-                marker=dict(size=6, color='yellow'),
-                name='Movement Path'
-            ))
-        
-        # Add start and end markers
-        if len(x_coords) > 0:
-            # Start point (green)
-            fig.add_trace(go.Scatter(
-                x=[x_coords[0]], y=[y_coords[0]],
-                mode='markers',
-                marker=dict(size=15, color='lime', symbol='circle',
-                           line=dict(color='white', width=2)),
-                name='Start',
-                hovertemplate='<b>START</b><br>X: %{x:.1f}<br>Y: %{y:.1f}<extra></extra>'
-            ))
-            
-            # End point (red)
-            fig.add_trace(go.Scatter(
-                x=[x_coords[-1]], y=[y_coords[-1]],
-                mode='markers',
-                marker=dict(size=15, color='red', symbol='square',
-                           line=dict(color='white', width=2)),
-                name='End',
-                hovertemplate='<b>END</b><br>X: %{x:.1f}<br>Y: %{y:.1f}<extra></extra>'
-            ))
+            markers.visible = False
         
-        return fig
+        frame_fig.layout.title.text = f"{player_name} - Frame {frame + 1} of {len(track)}"
+
+@st.fragment
+def _render_frame_viewer(gsis_id, play_key, player_name, track):
+    """Frame slider, metrics, chart and details for one play (track must be non-empty)
+    
+    A fragment of its own, so scrubbing re-runs just this block rather than the
+    whole tracking tab with its stats, histogram and raw-data preview.
+    """
+    total_frames = len(track)
+    
+    # Short plays can also play back in the browser, with nothing sent per frame
+    if total_frames <= TRACKING_ANIMATION_MAX_FRAMES:
+        playback = st.radio(
+            "Playback:",
+            ["Slider", "Animation"],
+            horizontal=True,
+            key="frame_playback",
+            help="Animation plays the frames in the browser; Slider shows frame metrics and details"
+        )
+        if playback == "Animation":
+            st.plotly_chart(
+                go.Figure(copy.deepcopy(
+                    get_frame_animation_figure(gsis_id, play_key, track.load_id, player_name, track)
+                )),
+                use_container_width=True, config=TRACKING_CHART_CONFIG, key="frame_animation_chart"
+            )
+            return
+    
+    # Frame slider
+    frame_col1, frame_col2 = st.columns([4, 1])
+    
+    with frame_col1:
+        current_frame = st.slider(
+            "Frame",
+            min_value=0,
+            max_value=total_frames - 1,
+            value=0,
+            key="frame_slider",
+            help="Drag to scrub through frames"
+        )
+    
+    with frame_col2:
+        st.markdown(f"**{current_frame + 1}** / {total_frames}")
+    
+    # Frame metrics, looked up from the per-play formatted strings
+    frame_metric_text = format_frame_metrics(gsis_id, play_key, track.load_id, track)
+    frame_metrics = st.columns(5)
+    
+    with frame_metrics[0]:
+        ts_label = track.ts_label[current_frame]
+        if ts_label is not None:
+            st.metric("⏱️ Time", ts_label)
+        else:
+            st.metric("⏱️ Frame", f"#{current_frame + 1}")
     
-    # -------------------------------------------------------------------------
-    # MAIN TRACKING TAB UI
-    # -------------------------------------------------------------------------
+    with frame_metrics[1]:
+        st.metric("📍 X Position", frame_metric_text['x'][current_frame])
+    
+    with frame_metrics[2]:
+        st.metric("📍 Y Position", frame_metric_text['y'][current_frame])
+    
+    with frame_metrics[3]:
+        st.metric("🚀 Speed", frame_metric_text['speed'][current_frame])
+    
+    with frame_metrics[4]:
+        st.metric("📈 Accel", frame_metric_text['accel'][current_frame])
+    
+    frame_fig = get_frame_figure(gsis_id, play_key, track)
+    set_figure_frame(frame_fig, track, current_frame, player_name)
+    
+    # A stable key keeps the same chart element, so the browser updates it in place
+    st.plotly_chart(
+        frame_fig, use_container_width=True, config=TRACKING_STATIC_CHART_CONFIG,
+        key="frame_chart"
+    )
+    
+    # Additional frame details
+    with st.expander("📊 Frame Details"):
+        frame_detail_text = format_frame_details(gsis_id, play_key, track.load_id, track)
+        if frame_detail_text[current_frame]:
+            st.markdown(frame_detail_text[current_frame])
+
+# ----------------------------------------------------------------------------
+# MAIN TRACKING TAB UI
+# ----------------------------------------------------------------------------
+
+@st.fragment
+def _render_tracking(filtered_view):
+    """Render the Player Tracking tab"""
+    st.markdown("## Player Tracking")
+    st.markdown("Visualize player movement and performance metrics")
     
     # Get players from the rankings data that might have tracking
-    tracking_player_options = [
-        f"{row['position']} - {row['player_display_name']}"
-        for _, row in filtered_df.sort_values(['position', 'player_display_name']).iterrows()
-        if pd.notna(row.get('gsis_player_id'))
-    ]
+    players = filtered_view.select(['position', 'player_display_name', 'gsis_player_id'])
+    if 'gsis_player_id' in players.columns:
+        players = players[players['gsis_player_id'].notna()]
+    else:
+        players = players.iloc[:0]
+    sorted_players = players.sort_values(['position', 'player_display_name'])
+    tracking_player_options = (
+        sorted_players['position'].astype(str) + " - " + sorted_players['player_display_name'].astype(str)
+    ).tolist()
     
     if not tracking_player_options:
         st.warning("No players available for tracking visualization")
@@ -1194,12 +2067,13 @@ with tab5:
             st.markdown("### Field Preview")
             preview_fig = create_field_figure()
             preview_fig.update_layout(title="Select a player to view tracking data")
-            st.plotly_chart(preview_fig, use_container_width=True)
+            st.plotly_chart(preview_fig, use_container_width=True, config=TRACKING_CHART_CONFIG)
             
         else:
             # Get player info
             player_name = selected_tracking_player.split(" - ", 1)[1]
-            player_info = filtered_df[filtered_df['player_display_name'] == player_name].iloc[0]
+            name_index, name_rows = get_name_index(filtered_view.select(['player_display_name']))
+            player_info = filtered_view.take(name_rows[name_index.get_loc(player_name)])
             gsis_id = player_info.get('gsis_player_id')
             
             if pd.isna(gsis_id):
@@ -1207,7 +2081,7 @@ with tab5:
             else:
                 # Load tracking data for this player (lazy loading)
                 with st.spinner(f"Loading tracking data for {player_name}..."):
-                    player_tracking = load_player_tracking(gsis_id)
+                    player_tracking, player_track, play_slices = load_player_tracking(gsis_id)
                 
                 if player_tracking.empty:
                     st.warning(f"No tracking data found for {player_name}")
@@ -1215,10 +2089,11 @@ with tab5:
                     # Show empty field
                     empty_fig = create_field_figure()
                     empty_fig.update_layout(title=f"No tracking data available for {player_name}")
-                    st.plotly_chart(empty_fig, use_container_width=True)
+                    st.plotly_chart(empty_fig, use_container_width=True, config=TRACKING_CHART_CONFIG)
                 else:
                     # Calculate stats
-                    stats = calculate_tracking_stats(player_tracking)
+                    stats = calculate_tracking_stats(gsis_id, None, player_track.load_id, player_tracking)
+                    tracking_cols = get_tracking_columns(player_tracking.columns)
                     
                     # ---------------------------------------------------------
                     # TOP KPI CARDS
@@ -1248,14 +2123,8 @@ with tab5:
                     # ---------------------------------------------------------
                     # PLAY SELECTION (if multiple plays available)
                     # ---------------------------------------------------------
-                    play_col = None
-                    if 'play_id' in player_tracking.columns:
-                        play_col = 'play_id'
-                    elif 'playId' in player_tracking.columns:
-                        play_col = 'playId'
-                    
-                    if play_col and player_tracking[play_col].nunique() > 1:
-                        unique_plays = player_tracking[play_col].unique()
+                    if len(play_slices) > 1:
+                        unique_plays = list(play_slices)
                         
                         st.markdown("### Select Play")
                         
@@ -1270,13 +2139,33 @@ with tab5:
                             selected_play = st.selectbox(
                                 "Select Play",
                                 unique_plays,
+                                format_func=lambda play: (
+                                    f"Game {play[0]} - Play {play[1]}" if isinstance(play, tuple) else str(play)
+                                ),
                                 key="play_select"
                             )
-                            display_tracking = player_tracking[player_tracking[play_col] == selected_play]
+                            # Positions of the play's frames, precomputed at load
+                            play_rows = play_slices[selected_play]
+                            display_tracking = player_tracking.iloc[play_rows]
+                            play_key = selected_play
                         else:
                             display_tracking = player_tracking
+                            play_rows = None
+                            play_key = None
                     else:
                         display_tracking = player_tracking
+                        play_rows = None
+                        play_key = None
+                    
+                    # Keep the displayed play's SoA arrays in session state: slider ticks
+                    # and view toggles reuse them until the player, play or loaded data changes
+                    view_key = (gsis_id, play_key, player_track.load_id)
+                    tracking_view = st.session_state.get('tracking_view')
+                    if tracking_view is None or tracking_view[0] != view_key:
+                        view_track = player_track if play_rows is None else player_track.subset(play_rows)
+                        tracking_view = (view_key, view_track)
+                        st.session_state['tracking_view'] = tracking_view
+                    display_track = tracking_view[1]
                     
                     # ---------------------------------------------------------
                     # FIELD VISUALIZATION WITH VIEW MODES
@@ -1291,9 +2180,8 @@ with tab5:
                         key="view_mode_select"
                     )
                     
-                    # Sort tracking data by timestamp
-                    if 'ts' in display_tracking.columns:
-                        display_tracking = display_tracking.sort_values('ts').reset_index(drop=True)
+                    # Frames are already in timestamp order from load_player_tracking
+                    display_tracking = display_tracking.reset_index(drop=True)
                     
                     # =============================================================
                     # PATH VIEW (Original)
@@ -1303,7 +2191,7 @@ with tab5:
                         
                         # Create field with player path
                         field_fig = create_field_figure()
-                        field_fig = add_player_path_to_field(field_fig, display_tracking, color_by_speed=True)
+                        field_fig = add_player_path_to_field(field_fig, display_track, color_by_speed='s' in tracking_cols)
                         field_fig.update_layout(
                             title=f"{player_name} - Movement Path",
                             showlegend=True,
@@ -1315,7 +2203,7 @@ with tab5:
                             )
                         )
                         
-                        st.plotly_chart(field_fig, use_container_width=True)
+                        st.plotly_chart(field_fig, use_container_width=True, config=TRACKING_CHART_CONFIG)
                     
                     # =============================================================
                     # HEAT MAP VIEW
@@ -1323,17 +2211,24 @@ with tab5:
                     elif view_mode == "🔥 Heat Map":
                         st.caption("Color intensity = Time spent in zone | Useful for coverage analysis")
                         
-                        if 'x' in display_tracking.columns and 'y' in display_tracking.columns:
+                        if 'x' in tracking_cols and 'y' in tracking_cols:
                             heat_fig = create_field_figure()
                             
-                            x_coords = display_tracking['x'].dropna().values
-                            y_coords = display_tracking['y'].dropna().values
+                            # Frames with both coordinates (the bins need x/y pairs)
+                            has_xy = ~(np.isnan(display_track.x) | np.isnan(display_track.y))
+                            x_coords, y_coords = display_track.x[has_xy], display_track.y[has_xy]
                             
                             if len(x_coords) > 0:
+                                # Bin on the server; the browser only gets the 40x20 grid
+                                heat_z, heat_x, heat_y = get_heat_map_grid(
+                                    gsis_id, play_key, display_track.load_id, x_coords, y_coords
+                                )
+                                
                                 # Add 2D histogram (heat map)
-                                heat_fig.add_trace(go.Histogram2d(
-                                    x=x_coords,
-                                    y=y_coords,
+                                heat_fig.add_trace(go.Heatmap(
+                                    z=heat_z,
+                                    x=heat_x,
+                                    y=heat_y,
                                     colorscale=[
                                         [0, 'rgba(0,0,0,0)'],        # Transparent for empty
                                         [0.1, 'rgba(0,0,255,0.3)'],  # Blue - low density
@@ -1343,8 +2238,6 @@ with tab5:
                                         [0.9, 'rgba(255,128,0,0.8)'],# Orange
                                         [1.0, 'rgba(255,0,0,0.9)']   # Red - high density
                                     ],
-                                    nbinsx=40,
-                                    nbinsy=20,
                                     colorbar=dict(
                                         title="Time<br>Density",
                                         x=1.02
@@ -1358,9 +2251,10 @@ with tab5:
                                 ))
                                 
                                 # Add contour overlay for cleaner visualization
-                                heat_fig.add_trace(go.Histogram2dContour(
-                                    x=x_coords,
-                                    y=y_coords,
+                                heat_fig.add_trace(go.Contour(
+                                    z=heat_z,
+                                    x=heat_x,
+                                    y=heat_y,
                                     colorscale='Hot',
                                     showscale=False,
                                     contours=dict(
@@ -1369,7 +2263,8 @@ with tab5:
                                     ),
                                     line=dict(width=1, color='white'),
                                     ncontours=8,
-                                    opacity=0.5
+                                    opacity=0.5,
+                                    hoverinfo='skip'
                                 ))
                             
                             heat_fig.update_layout(
@@ -1377,7 +2272,7 @@ with tab5:
                                 showlegend=False
                             )
                             
-                            st.plotly_chart(heat_fig, use_container_width=True)
+                            st.plotly_chart(heat_fig, use_container_width=True, config=TRACKING_CHART_CONFIG)
                             
                             # Heat map insights
                             st.markdown("#### 🔍 Zone Analysis")
@@ -1385,22 +2280,18 @@ with tab5:
                             # Calculate zone stats
                             zone_col1, zone_col2, zone_col3 = st.columns(3)
                             
+                            left_pct, deep_pct, middle_pct = get_zone_shares(
+                                gsis_id, play_key, display_track.load_id, x_coords, y_coords
+                            )
+                            
                             with zone_col1:
-                                # Left/Right distribution
-                                left_side = (x_coords < 60).sum()
-                                right_side = (x_coords >= 60).sum()
-                                total = len(x_coords)
-                                st.metric("Left Side", f"{left_side/total*100:.1f}%")
+                                st.metric("Left Side", f"{left_pct:.1f}%")
                             
                             with zone_col2:
-                                # Deep/Short distribution
-                                deep = ((x_coords < 30) | (x_coords > 90)).sum()
-                                st.metric("End Zone Area", f"{deep/total*100:.1f}%")
+                                st.metric("End Zone Area", f"{deep_pct:.1f}%")
                             
                             with zone_col3:
-                                # Middle of field
-                                middle = ((y_coords > 20) & (y_coords < 33.3)).sum()
-                                st.metric("Middle of Field", f"{middle/total*100:.1f}%")
+                                st.metric("Middle of Field", f"{middle_pct:.1f}%")
                         else:
                             st.warning("Position data (x, y) not available for heat map")
                     
@@ -1411,182 +2302,8 @@ with tab5:
                         st.caption("Scrub through individual frames to analyze positioning")
                         
                         if len(display_tracking) > 0:
-                            total_frames = len(display_tracking)
-                            
-                            # Frame slider
-                            frame_col1, frame_col2 = st.columns([4, 1])
-                            
-                            with frame_col1:
-                                current_frame = st.slider(
-                                    "Frame",
-                                    min_value=0,
-                                    max_value=total_frames - 1,
-                                    value=0,
-                                    key="frame_slider",
-                                    help="Drag to scrub through frames"
-                                )
-                            
-                            with frame_col2:
-                                st.markdown(f"**{current_frame + 1}** / {total_frames}")
-                            
-                            # Get current frame data
-                            current_data = display_tracking.iloc[current_frame]
-                            
-                            # Frame metrics
-                            frame_metrics = st.columns(5)
-                            
-                            with frame_metrics[0]:
-                                if 'ts' in display_tracking.columns and pd.notna(current_data.get('ts')):
-                                    ts_val = pd.to_datetime(current_data['ts'])
-                                    st.metric("⏱️ Time", ts_val.strftime("%H:%M:%S.%f")[:-3])
-                                else:
-                                    st.metric("⏱️ Frame", f"#{current_frame + 1}")
-                            
-                            with frame_metrics[1]:
-                                x_val = current_data.get('x', 0)
-                                st.metric("📍 X Position", f"{x_val:.1f} yds" if pd.notna(x_val) else "N/A")
-                            
-                            with frame_metrics[2]:
-                                y_val = current_data.get('y', 0)
-                                st.metric("📍 Y Position", f"{y_val:.1f} yds" if pd.notna(y_val) else "N/A")
-                            
-                            with frame_metrics[3]:
-                                speed_val = current_data.get('s', 0)
-                                speed_mph = speed_val * 2.045 if pd.notna(speed_val) else 0
-                                st.metric("🚀 Speed", f"{speed_mph:.1f} MPH")
-                            
-                            with frame_metrics[4]:
-                                accel_val = current_data.get('a', 0)
-                                st.metric("📈 Accel", f"{accel_val:.2f}" if pd.notna(accel_val) else "N/A")
-                            
-                            # Create field with frame position
-                            frame_fig = create_field_figure()
-                            
-                            # Add path up to current frame (faded)
-                            if current_frame > 0:
-                                path_df = display_tracking.iloc[:current_frame + 1]
-                                if 'x' in path_df.columns and 'y' in path_df.columns:
-                                    frame_fig.add_trace(go.Scatter(
-                                        x=path_df['x'].values,
-                                        y=path_df['y'].values,
-                                        mode='lines',
-                                        line=dict(width=2, color='rgba(255,255,0,0.4)'),
-                                        name='Path History',
-                                        hoverinfo='skip'
-                                    ))
-                            
-                            # Add future path (very faded)
-                            if current_frame < total_frames - 1:
-                                future_df = display_tracking.iloc[current_frame:]
-                                if 'x' in future_df.columns and 'y' in future_df.columns:
-                                    frame_fig.add_trace(go.Scatter(
-                                        x=future_df['x'].values,
-                                        y=future_df['y'].values,
-                                        mode='lines',
-                                        line=dict(width=1, color='rgba(255,255,255,0.2)', dash='dot'),
-                                        name='Future Path',
-                                        hoverinfo='skip'
-                                    ))
-                            
-                            # Add current position (large marker)
-                            if pd.notna(current_data.get('x')) and pd.notna(current_data.get('y')):
-                                # Direction arrow if available
-                                if pd.notna(current_data.get('dir')):
-                                    dir_rad = np.radians(current_data['dir'])
-                                    arrow_len = 3
-                                    dx = arrow_len * np.sin(dir_rad)
-                                    dy = arrow_len * np.cos(dir_rad)
-                                    
-                                    frame_fig.add_annotation(
-                                        x=current_data['x'],
-                                        y=current_data['y'],
-                                        ax=current_data['x'] + dx,
-                                        ay=current_data['y'] + dy,
-                                        xref="x", yref="y",
-                                        axref="x", ayref="y",
-                                        showarrow=True,
-                                        arrowhead=2,
-                                        arrowsize=1.5,
-                                        arrowwidth=3,
-                                        arrowcolor="cyan"
-                                    )
-                                
-                                # Player marker
-                                speed_color = 'red' if speed_mph > 15 else 'yellow' if speed_mph > 10 else 'lime'
-                                frame_fig.add_trace(go.Scatter(
-                                    x=[current_data['x']],
-                                    y=[current_data['y']],
-                                    mode='markers',
-                                    marker=dict(
-                                        size=20,
-                                        color=speed_color,
-                                        symbol='circle',
-                                        line=dict(color='white', width=3)
-                                    ),
-                                    name=f'Current Position',
-                                    hovertemplate=(
-                                        f'<b>{player_name}</b><br>'
-                                        f'X: {current_data["x"]:.1f}<br>'
-                                        f'Y: {current_data["y"]:.1f}<br>'
-                                        f'Speed: {speed_mph:.1f} MPH<br>'
-                                        '<extra></extra>'
-                                    )
-                                ))
-                            
-                            # Start marker
-                            first_frame = display_tracking.iloc[0]
-                            if pd.notna(first_frame.get('x')) and pd.notna(first_frame.get('y')):
-                                frame_fig.add_trace(go.Scatter(
-                                    x=[first_frame['x']],
-                                    y=[first_frame['y']],
-                                    mode='markers',
-                                    marker=dict(size=12, color='lime', symbol='circle',
-                                               line=dict(color='white', width=2)),
-                                    name='Start',
-                                    hoverinfo='skip'
-                                ))
-                            
-                            frame_fig.update_layout(
-                                title=f"{player_name} - Frame {current_frame + 1} of {total_frames}",
-                                showlegend=True,
-                                legend=dict(
-                                    yanchor="top", y=0.99,
-                                    xanchor="left", x=0.01,
-                                    bgcolor="rgba(0,0,0,0.5)",
-                                    font=dict(color="white")
-                                )
-                            )
-                            
-                            st.plotly_chart(frame_fig, use_container_width=True)
-                            
-                            # Additional frame details
-                            with st.expander("📊 Frame Details"):
-                                detail_cols = ['ts', 'x', 'y', 's', 'a', 'dis', 'dir', 'o']
-                                available_detail_cols = [c for c in detail_cols if c in display_tracking.columns]
-                                
-                                frame_details = {}
-                                for col in available_detail_cols:
-                                    val = current_data.get(col)
-                                    if col == 's' and pd.notna(val):
-                                        frame_details['Speed (yds/s)'] = f"{val:.2f}"
-                                        frame_details['Speed (MPH)'] = f"{val * 2.045:.2f}"
-                                    elif col == 'a' and pd.notna(val):
-                                        frame_details['Acceleration'] = f"{val:.3f}"
-                                    elif col == 'dis' and pd.notna(val):
-                                        frame_details['Distance'] = f"{val:.3f}"
-                                    elif col == 'dir' and pd.notna(val):
-                                        frame_details['Direction (°)'] = f"{val:.1f}"
-                                    elif col == 'o' and pd.notna(val):
-                                        frame_details['Orientation (°)'] = f"{val:.1f}"
-                                    elif col == 'x' and pd.notna(val):
-                                        frame_details['X Position'] = f"{val:.2f}"
-                                    elif col == 'y' and pd.notna(val):
-                                        frame_details['Y Position'] = f"{val:.2f}"
-                                    elif col == 'ts' and pd.notna(val):
-                                        frame_details['Timestamp'] = str(val)
-                                
-                                for k, v in frame_details.items():
-                                    st.markdown(f"**{k}:** {v}")
+                            # Rendered as its own fragment: slider moves rerun only the frame viewer
+                            _render_frame_viewer(gsis_id, play_key, player_name, display_track)
                         else:
                             st.warning("No frames available for this play")
                     
@@ -1596,69 +2313,53 @@ with tab5:
                     st.markdown("---")
                     st.markdown("### Detailed Statistics")
                     
+                    speed_stats, activity_stats = get_detailed_tracking_stats(gsis_id, player_track.load_id, player_tracking)
+                    
                     # Create two-column layout for stats
                     stat_col1, stat_col2 = st.columns(2)
                     
+                    # One table element per column instead of a markdown element per stat
                     with stat_col1:
                         st.markdown("#### Speed & Acceleration")
-                        speed_stats = {
-                            "Max Speed (MPH)": f"{stats.get('max_speed_mph', 0):.2f}",
-                            "Avg Speed (MPH)": f"{stats.get('avg_speed_mph', 0):.2f}",
-                            "Min Speed (MPH)": f"{stats.get('min_speed_mph', 0):.2f}",
-                            "Max Acceleration (yds/s²)": f"{stats.get('max_acceleration', 0):.2f}",
-                            "Avg Acceleration (yds/s²)": f"{stats.get('avg_acceleration', 0):.2f}",
-                        }
-                        for stat_name, stat_value in speed_stats.items():
-                            st.markdown(f"**{stat_name}:** {stat_value}")
+                        st.table(speed_stats)
                     
                     with stat_col2:
                         st.markdown("#### Distance & Activity")
-                        activity_stats = {
-                            "Total Distance (yds)": f"{stats.get('total_distance', 0):.1f}",
-                            "Total Frames": f"{stats.get('total_frames', 0):,}",
-                            "Direction Changes (>45°)": f"{stats.get('direction_changes', 0):,}",
-                        }
-                        if 'play_count' in stats:
-                            activity_stats["Plays Tracked"] = f"{stats.get('play_count', 0)}"
-                        if 'total_time_seconds' in stats:
-                            activity_stats["Total Time (sec)"] = f"{stats.get('total_time_seconds', 0):.1f}"
-                        
-                        for stat_name, stat_value in activity_stats.items():
-                            st.markdown(f"**{stat_name}:** {stat_value}")
+                        st.table(activity_stats)
                     
                     # ---------------------------------------------------------
                     # SPEED DISTRIBUTION CHART
                     # ---------------------------------------------------------
-                    if 's' in display_tracking.columns:
+                    if 's' in tracking_cols:
                         st.markdown("---")
                         st.markdown("### Speed Distribution")
                         
                         speed_fig = go.Figure()
                         
-                        speeds_mph = display_tracking['s'].dropna() * 2.045
-                        
-                        speed_fig.add_trace(go.Histogram(
-                            x=speeds_mph,
-                            nbinsx=30,
+                        speed_counts, speed_centers, speed_widths, avg_speed, max_speed = get_speed_histogram(
+                            gsis_id, play_key, display_track.load_id, display_track
+                        )
+                        speed_fig.add_trace(go.Bar(
+                            x=speed_centers,
+                            y=speed_counts,
+                            width=speed_widths,
                             marker_color='#1f77b4',
                             opacity=0.75,
                             name='Speed Distribution'
                         ))
                         
                         # Add vertical lines for avg and max
-                        avg_speed = speeds_mph.mean()
-                        max_speed = speeds_mph.max()
-                        
-                        speed_fig.add_vline(
-                            x=avg_speed, line_dash="dash", line_color="yellow",
-                            annotation_text=f"Avg: {avg_speed:.1f}",
-                            annotation_position="top"
-                        )
-                        speed_fig.add_vline(
-                            x=max_speed, line_dash="dash", line_color="red",
-                            annotation_text=f"Max: {max_speed:.1f}",
-                            annotation_position="top"
-                        )
+                        if avg_speed is not None:
+                            speed_fig.add_vline(
+                                x=avg_speed, line_dash="dash", line_color="yellow",
+                                annotation_text=f"Avg: {avg_speed:.1f}",
+                                annotation_position="top"
+                            )
+                            speed_fig.add_vline(
+                                x=max_speed, line_dash="dash", line_color="red",
+                                annotation_text=f"Max: {max_speed:.1f}",
+                                annotation_position="top"
+                            )
                         
                         speed_fig.update_layout(
                             xaxis_title="Speed (MPH)",
@@ -1668,25 +2369,35 @@ with tab5:
                             showlegend=False
                         )
                         
-                        st.plotly_chart(speed_fig, use_container_width=True)
+                        st.plotly_chart(speed_fig, use_container_width=True, config=TRACKING_STATIC_CHART_CONFIG)
                     
                     # ---------------------------------------------------------
                     # RAW DATA EXPANDER (Optional)
                     # ---------------------------------------------------------
                     with st.expander("📊 View Raw Tracking Data"):
-                        display_cols = ['ts', 'x', 'y', 's', 'a', 'dis', 'dir', 'o']
-                        available_cols = [c for c in display_cols if c in display_tracking.columns]
-                        
-                        if play_col and play_col in display_tracking.columns:
-                            available_cols = [play_col] + available_cols
+                        # Slice the rows before projecting columns so only the preview is copied
+                        preview = display_tracking.iloc[:500].loc[:, list(tracking_cols)]
+                        try:
+                            import pyarrow  # noqa: F401
+                            # Arrow-backed columns go to the grid without another conversion
+                            preview = preview.convert_dtypes(dtype_backend='pyarrow', convert_integer=False)
+                        except ImportError:
+                            pass
                         
                         st.dataframe(
-                            display_tracking[available_cols].head(500),
+                            preview,
                             use_container_width=True,
                             hide_index=True
                         )
                         st.caption(f"Showing first 500 of {len(display_tracking):,} frames")
 
+# Pay the first-call JIT cost at startup rather than on the first player selection
+warm_up_tracking_kernels()
+
+with tab5:
+    if tab5.open:
+        _render_tracking(filtered_view)
+
 # ============================================================================
 # FOOTER
 # ============================================================================
@@ -0,0 +1,247 @@
+"""
+Numeric kernels for the Player Tracking tab
+
+Small loops over 1D tracking arrays, compiled with Numba when it is installed
+(cache=True keeps the compiled code on disk between app restarts, and
+warm_up() pays the compile or cache-load cost up front). Without Numba the
+same functions fall back to NumPy implementations.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _summarize_tracking_loop(s, a, dis, dir_):
+    """Single pass over the speed, acceleration, distance and direction columns
+
+    NaNs are skipped. Returns
+    (s_count, s_max, s_sum, s_min, a_count, a_max, a_sum, dis_count, dis_sum,
+     dir_count, dir_changes) where dir_changes counts >45 degree turns between
+    consecutive non-NaN directions.
+    """
+    s_count = 0
+    s_max = -np.inf
+    s_min = np.inf
+    s_sum = 0.0
+    for i in range(s.shape[0]):
+        v = s[i]
+        if v == v:
+            s_count += 1
+            s_sum += v
+            if v > s_max:
+                s_max = v
+            if v < s_min:
+                s_min = v
+
+    a_count = 0
+    a_max = -np.inf
+    a_sum = 0.0
+    for i in range(a.shape[0]):
+        v = a[i]
+        if v == v:
+            a_count += 1
+            a_sum += v
+            if v > a_max:
+                a_max = v
+
+    dis_count = 0
+    dis_sum = 0.0
+    for i in range(dis.shape[0]):
+        v = dis[i]
+        if v == v:
+            dis_count += 1
+            dis_sum += v
+
+    # Direction changes, accounting for the 360-degree wraparound
+    dir_count = 0
+    dir_changes = 0
+    prev = 0.0
+    for i in range(dir_.shape[0]):
+        v = dir_[i]
+        if v == v:
+            if dir_count > 0:
+                d = abs(v - prev)
+                if 360.0 - d < d:
+                    d = 360.0 - d
+                if d > 45.0:
+                    dir_changes += 1
+            prev = v
+            dir_count += 1
+
+    return (s_count, s_max, s_sum, s_min, a_count, a_max, a_sum,
+            dis_count, dis_sum, dir_count, dir_changes)
+
+
+def _summarize_tracking_numpy(s, a, dis, dir_):
+    """NumPy equivalent of _summarize_tracking_loop"""
+    s = s[~np.isnan(s)]
+    a = a[~np.isnan(a)]
+    dis = dis[~np.isnan(dis)]
+    dir_ = dir_[~np.isnan(dir_)]
+
+    dir_changes = 0
+    if len(dir_) > 1:
+        d = np.abs(np.diff(dir_))
+        np.minimum(d, 360.0 - d, out=d)
+        dir_changes = int(np.count_nonzero(d > 45))
+
+    return (
+        len(s), float(s.max(initial=-np.inf)), float(s.sum(dtype=np.float64)),
+        float(s.min(initial=np.inf)),
+        len(a), float(a.max(initial=-np.inf)), float(a.sum(dtype=np.float64)),
+        len(dis), float(dis.sum(dtype=np.float64)),
+        len(dir_), dir_changes,
+    )
+
+
+def _speed_range_loop(s):
+    """(count, min, max, sum) of the non-NaN values in one pass"""
+    count = 0
+    s_min = np.inf
+    s_max = -np.inf
+    s_sum = 0.0
+    for i in range(s.shape[0]):
+        v = s[i]
+        if v == v:
+            count += 1
+            s_sum += v
+            if v < s_min:
+                s_min = v
+            if v > s_max:
+                s_max = v
+    return count, s_min, s_max, s_sum
+
+
+def _speed_range_numpy(s):
+    """NumPy equivalent of _speed_range_loop"""
+    s = s[~np.isnan(s)]
+    return (
+        len(s), float(s.min(initial=np.inf)), float(s.max(initial=-np.inf)),
+        float(s.sum(dtype=np.float64)),
+    )
+
+
+def _count_zones_loop(x, y):
+    """Frames on the left side (x < 60), in the end zone areas (x < 30 or x > 90)
+    and in the middle of the field (20 < y < 33.3), from one pass over x/y"""
+    left = 0
+    deep = 0
+    middle = 0
+    for i in range(x.shape[0]):
+        xi = x[i]
+        yi = y[i]
+        if xi < 60:
+            left += 1
+        if xi < 30 or xi > 90:
+            deep += 1
+        if yi > 20 and yi < 33.3:
+            middle += 1
+    return left, deep, middle
+
+
+def _count_zones_numpy(x, y):
+    """NumPy equivalent of _count_zones_loop"""
+    return (
+        int(np.count_nonzero(x < 60)),
+        int(np.count_nonzero((x < 30) | (x > 90))),
+        int(np.count_nonzero((y > 20) & (y < 33.3))),
+    )
+
+
+def _lttb_indices_loop(x, y, n_out):
+    """Positions of the points Largest-Triangle-Three-Buckets keeps from an x/y path
+
+    Points stay in frame order; each bucket keeps the point forming the biggest
+    triangle with the previously kept point and the next bucket's centroid, so
+    turns and sprints survive the downsample. First and last points are always kept.
+    """
+    n = x.shape[0]
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0] = 0
+    kept[n_out - 1] = n - 1
+    prev = 0
+    for b in range(n_out - 2):
+        lo = edges[b]
+        hi = edges[b + 1]
+        # Centroid of the next bucket (the last point for the final bucket)
+        nxt_hi = edges[b + 2] if b + 2 < n_out - 1 else n
+        cx = 0.0
+        cy = 0.0
+        for j in range(hi, nxt_hi):
+            cx += x[j]
+            cy += y[j]
+        cx /= nxt_hi - hi
+        cy /= nxt_hi - hi
+
+        px = x[prev]
+        py = y[prev]
+        best_area = -1.0
+        best = lo
+        for j in range(lo, hi):
+            area = abs((px - cx) * (y[j] - py) - (px - x[j]) * (cy - py))
+            if area > best_area:
+                best_area = area
+                best = j
+        kept[b + 1] = best
+        prev = best
+    return kept
+
+
+def _lttb_indices_numpy(x, y, n_out):
+    """NumPy equivalent of _lttb_indices_loop (vectorised within each bucket)"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    prev = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        nxt_hi = edges[b + 2] if b + 2 < len(edges) else n
+        cx = x[hi:nxt_hi].mean()
+        cy = y[hi:nxt_hi].mean()
+
+        px, py = x[prev], y[prev]
+        area = np.abs((px - cx) * (y[lo:hi] - py) - (px - x[lo:hi]) * (cy - py))
+        prev = lo + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        kept[b + 1] = prev
+    return kept
+
+
+# fastmath without 'nnan'/'ninf': the stats loops rely on v == v to skip NaNs
+# and on -inf/inf as the starting max/min, but may reorder its float64 sums
+SUMMARY_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+if njit is not None:
+    summarize_tracking = njit(cache=True, fastmath=SUMMARY_FASTMATH)(_summarize_tracking_loop)
+    speed_range = njit(cache=True, fastmath=SUMMARY_FASTMATH)(_speed_range_loop)
+    count_zones = njit(cache=True)(_count_zones_loop)
+    lttb_indices = njit(cache=True)(_lttb_indices_loop)
+else:
+    summarize_tracking = _summarize_tracking_numpy
+    speed_range = _speed_range_numpy
+    count_zones = _count_zones_numpy
+    lttb_indices = _lttb_indices_numpy
+
+
+def warm_up():
+    """Call each kernel once on tiny inputs of the dtypes the app passes
+
+    Every kernel gets float32 arrays, as loaded from the tracking dataset. A
+    no-op apart from the calls themselves when Numba isn't installed.
+    """
+    f32 = np.array([1.0, 2.0, np.nan, 4.0], dtype=np.float32)
+    summarize_tracking(f32, f32, f32, f32)
+    speed_range(f32)
+    count_zones(f32, f32)
+    lttb_indices(f32, f32, 3)